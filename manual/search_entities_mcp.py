@@ -4,7 +4,6 @@
 import asyncio
 import json
 import os
-import subprocess
 import sys
 
 from dotenv import load_dotenv
@@ -12,30 +11,40 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+async def _drain(stream: asyncio.StreamReader) -> None:
+    """Discard child output so a full pipe never blocks the server."""
+    while await stream.read(65536):
+        pass
+
+
 async def verify_search_entities_via_mcp(token: str) -> bool:
-    process = subprocess.Popen(
-        ["sensortower-mcp", "--transport", "stdio"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+    process = await asyncio.create_subprocess_exec(
+        "sensortower-mcp",
+        "--transport",
+        "stdio",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
         env={**os.environ, "SENSOR_TOWER_API_TOKEN": token},
+        # tools/list responses are a single JSON line well beyond the 64 KiB default
+        limit=16 * 1024 * 1024,
     )
 
     await asyncio.sleep(2)
-    if process.poll() is not None:
-        stdout, stderr = process.communicate()
+    if process.returncode is not None:
+        _, stderr = await process.communicate()
         print("❌ MCP server failed to start")
-        print(stderr)
+        print(stderr.decode(errors="replace"))
         return False
 
-    assert process.stdin and process.stdout
+    assert process.stdin and process.stdout and process.stderr
+    stderr_task = asyncio.create_task(_drain(process.stderr))
 
-    def send(payload: dict) -> None:
-        process.stdin.write(json.dumps(payload) + "\n")
-        process.stdin.flush()
+    async def send(payload: dict) -> None:
+        process.stdin.write((json.dumps(payload) + "\n").encode())
+        await process.stdin.drain()
 
-    send(
+    await send(
         {
             "jsonrpc": "2.0",
             "id": 1,
@@ -47,10 +56,10 @@ async def verify_search_entities_via_mcp(token: str) -> bool:
             },
         }
     )
-    send({"jsonrpc": "2.0", "method": "notifications/initialized"})
-    send({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+    await send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+    await send({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
     await asyncio.sleep(1)
-    send(
+    await send(
         {
             "jsonrpc": "2.0",
             "id": 3,
@@ -67,13 +76,15 @@ async def verify_search_entities_via_mcp(token: str) -> bool:
         }
     )
 
-    await asyncio.sleep(3)
     success = False
     for _ in range(20):
-        line = process.stdout.readline()
-        if not line:
+        try:
+            raw_line = await asyncio.wait_for(process.stdout.readline(), timeout=10)
+        except asyncio.TimeoutError:
             break
-        line = line.strip()
+        if not raw_line:
+            break
+        line = raw_line.decode(errors="replace").strip()
         if not line:
             continue
         try:
@@ -90,10 +101,14 @@ async def verify_search_entities_via_mcp(token: str) -> bool:
                 success = "\"apps\"" in text_block
             break
 
-    process.terminate()
-    await asyncio.sleep(1)
-    if process.poll() is None:
-        process.kill()
+    if process.returncode is None:
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), 2)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+    stderr_task.cancel()
 
     return success
 
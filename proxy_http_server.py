@@ -4,8 +4,11 @@ HTTP Proxy server for connecting Claude Desktop to remote Sensor Tower MCP serve
 This runs as an HTTP server and forwards requests to the remote HTTP server
 """
 
+from contextlib import asynccontextmanager
+
 import httpx
 from starlette.applications import Starlette
+from starlette.background import BackgroundTask
 from starlette.responses import JSONResponse, StreamingResponse
 from starlette.requests import Request
 from starlette.routing import Route
@@ -14,6 +17,19 @@ import uvicorn
 # Define the upstream server (internal Docker hostname)
 UPSTREAM_URL = "http://sensortowermcp:8666/mcp/"
 
+# Request headers that describe the client hop and must not be forwarded
+REQUEST_HOP_HEADERS = frozenset({
+    b"host", b"content-length", b"transfer-encoding", b"connection",
+    b"keep-alive", b"te", b"upgrade",
+})
+MCP_ACCEPT = b"application/json, text/event-stream"
+
+# Response headers that describe the upstream hop rather than the payload
+RESPONSE_HOP_HEADERS = frozenset({"connection", "keep-alive", "transfer-encoding"})
+
+# Shared upstream client so keep-alive connections survive across requests
+upstream_client = httpx.AsyncClient(timeout=30.0)
+
 async def health_endpoint(request: Request) -> JSONResponse:
     """Health check endpoint for the proxy"""
     return JSONResponse({
@@ -26,16 +42,20 @@ async def health_endpoint(request: Request) -> JSONResponse:
 async def proxy_mcp(request: Request) -> StreamingResponse:
     """Proxy MCP requests with fixed Accept headers"""
     
-    # Get the original headers and fix the Accept header
-    headers = dict(request.headers)
-    
-    # If only application/json is present, add text/event-stream
-    accept_header = headers.get("accept", "")
-    if "application/json" in accept_header and "text/event-stream" not in accept_header:
-        headers["accept"] = "application/json, text/event-stream"
-    
-    # Remove host header to avoid conflicts
-    headers.pop("host", None)
+    # Copy the raw header pairs in one pass, skipping hop-by-hop names and
+    # adding text/event-stream when only application/json is accepted
+    headers = []
+    saw_accept = False
+    for name, value in request.headers.raw:
+        if name in REQUEST_HOP_HEADERS:
+            continue
+        if name == b"accept":
+            saw_accept = True
+            if b"application/json" in value and b"text/event-stream" not in value:
+                value = MCP_ACCEPT
+        headers.append((name, value))
+    if not saw_accept:
+        headers.append((b"accept", MCP_ACCEPT))
     
     # Get request body
     body = await request.body()
@@ -45,22 +65,28 @@ async def proxy_mcp(request: Request) -> StreamingResponse:
     
     # Forward the request to upstream with timeout handling
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            upstream_response = await client.request(
-                method=request.method,
-                url=f"{UPSTREAM_URL}{path}",
-                headers=headers,
-                content=body,
-                params=request.query_params
-            )
-            
-            # Return the response as a stream
-            return StreamingResponse(
-                iter([upstream_response.content]),
-                status_code=upstream_response.status_code,
-                headers=dict(upstream_response.headers),
-                media_type=upstream_response.headers.get("content-type")
-            )
+        upstream_request = upstream_client.build_request(
+            method=request.method,
+            url=f"{UPSTREAM_URL}{path}",
+            headers=headers,
+            content=body,
+            params=request.query_params
+        )
+        upstream_response = await upstream_client.send(upstream_request, stream=True)
+
+        # Relay the still-encoded bytes so Content-Encoding stays accurate
+        response_headers = {
+            name: value
+            for name, value in upstream_response.headers.items()
+            if name.lower() not in RESPONSE_HOP_HEADERS
+        }
+        return StreamingResponse(
+            upstream_response.aiter_raw(),
+            status_code=upstream_response.status_code,
+            headers=response_headers,
+            media_type=upstream_response.headers.get("content-type"),
+            background=BackgroundTask(upstream_response.aclose)
+        )
     except httpx.ConnectTimeout:
         return JSONResponse(
             {"error": "Upstream server connection timeout", "upstream": UPSTREAM_URL},
@@ -72,6 +98,12 @@ async def proxy_mcp(request: Request) -> StreamingResponse:
             status_code=502
         )
 
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    """Close pooled upstream connections when the proxy stops"""
+    yield
+    await upstream_client.aclose()
+
 # Create Starlette app
 routes = [
     Route("/health", health_endpoint, methods=["GET"]),
@@ -79,7 +111,7 @@ routes = [
     Route("/mcp/{path:path}", proxy_mcp, methods=["GET", "POST", "PUT", "DELETE", "PATCH"]),
 ]
 
-app = Starlette(routes=routes)
+app = Starlette(routes=routes, lifespan=lifespan)
 
 if __name__ == "__main__":
     # Run the proxy as an HTTP server
@@ -4,20 +4,78 @@ Base classes and utilities for Sensor Tower MCP tools
 """
 
 import asyncio
+import copy
 import inspect
-from functools import wraps
-from typing import Any, Awaitable, Callable, Dict, Optional
+import random
+import re
+import time
+import weakref
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache, wraps
+from types import CoroutineType, MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import httpx
 
 from fastmcp.exceptions import ToolError
 from fastmcp import FastMCP
 
+from .config import (
+    COALESCE_WINDOW_SECONDS,
+    RESPONSE_CACHE_PATH,
+    UPSTREAM_CONCURRENCY,
+    create_http_client,
+)
+from .response_store import ResponseStore
+from .serialization import json_loads, json_loads_stream
 from .tool_examples import TOOL_ARGUMENT_EXAMPLES
 
 DEFAULT_TOOL_VERSION = "1.0"
 
-
+# Endpoints whose multi-megabyte bodies are decoded while streaming
+STREAMED_ENDPOINT_SUFFIXES = (
+    "/ad_intel/creatives",
+    "/ad_intel/network_analysis",
+    "/review/get_reviews",
+)
+
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 5
+# Upper bound on in-flight requests when one tool call is split into batches
+_BATCH_CONCURRENCY = 10
+# Largest app ID list a coalesced request may carry
+_COALESCE_MAX_IDS = 100
+# Record fields that identify the app a row belongs to, in lookup order
+_APP_ID_FIELDS = ("app_id", "aid", "unified_app_id")
+
+# Seconds to reuse responses from slow-moving endpoints, keyed by the path
+# after /v1/{os}/; other endpoints are never cached
+RESPONSE_CACHE_TTLS: Mapping[str, float] = MappingProxyType({
+    "app_update/get_app_update_history": 24 * 3600.0,
+    "apps/version_history": 24 * 3600.0,
+    "apps": 3600.0,
+    "apps/top_in_app_purchases": 3600.0,
+    "category/category_ranking_summary": 3600.0,
+    "compact_sales_report_estimates": 6 * 3600.0,
+    "sales_report_estimates": 1800.0,
+})
+_RESPONSE_CACHE_SIZE = 2048
+# Empty responses from the endpoints above are kept for at most this long
+_NEGATIVE_CACHE_TTL = 300.0
+# Raw bodies counted as empty, so the check needs no JSON decode
+_EMPTY_BODIES = frozenset({b"", b"[]", b"{}", b"null"})
+# Expired non-empty entries are still served for this fraction of their TTL
+# while one background request refreshes them
+_STALE_GRACE_FACTOR = 0.5
+
+_DEFAULT_OS = frozenset(("ios", "android", "unified"))
+_DEFAULT_OS_MESSAGE = "ios, android, unified"
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_COUNTRIES_RE = re.compile(r"[A-Za-z]{2}(?:,[A-Za-z]{2})*")
+
+
+@lru_cache(maxsize=256)
 def _to_title(name: str) -> str:
     """Convert snake_case identifiers into title case."""
 
@@ -26,21 +84,37 @@ def _to_title(name: str) -> str:
     return " ".join(part.capitalize() for part in name.split("_"))
 
 
+# Default annotation titles for every tool with an examples record.
+TOOL_TITLES: Dict[str, str] = {name: _to_title(name) for name in TOOL_ARGUMENT_EXAMPLES}
+
+
+@lru_cache(maxsize=512)
+def _frozen_annotations(
+    title: str, read_only: bool, idempotent: bool, open_world: bool
+) -> Mapping[str, Any]:
+    return MappingProxyType(
+        {
+            "title": title,
+            "readOnlyHint": read_only,
+            "idempotentHint": idempotent,
+            "openWorldHint": open_world,
+        }
+    )
+
+
 def build_tool_annotations(
     *,
     title: str,
     read_only: bool = True,
     idempotent: bool = True,
     open_world: bool = True,
-) -> Dict[str, Any]:
-    """Create a consistent annotations payload for tool decorators."""
+) -> Mapping[str, Any]:
+    """Create a consistent, read-only annotations payload for tool decorators.
 
-    return {
-        "title": title,
-        "readOnlyHint": read_only,
-        "idempotentHint": idempotent,
-        "openWorldHint": open_world,
-    }
+    Payloads are shared between calls with the same arguments.
+    """
+
+    return _frozen_annotations(title, read_only, idempotent, open_world)
 
 
 def build_decorator_meta(
@@ -60,47 +134,448 @@ def build_decorator_meta(
 
     docs_meta = build_tool_metadata(tool_name)
     if docs_meta:
-        meta.update(docs_meta)
+        meta.update(copy.deepcopy(dict(docs_meta)))
 
     if extra:
         meta.update(extra)
 
     return meta
 
+def _should_retry(error: Exception, attempt_index: int) -> bool:
+    """Decide whether a failed attempt should be retried."""
+
+    if attempt_index >= _MAX_ATTEMPTS - 1:
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(error, (httpx.ReadTimeout, httpx.ConnectError))
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    """Return the delay requested by a numeric Retry-After header, or 0."""
+
+    value = response.headers.get("Retry-After")
+    if not value:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        # HTTP-date values are rare for this API; fall back to our own backoff
+        return 0.0
+
+
+# One pooled client per auth token; the token is a default query parameter
+_shared_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_shared_client(token: str) -> httpx.AsyncClient:
+    """Return the process-wide API client for ``token``, creating it on first use.
+
+    httpx pools connections per client, so every tool group should share one
+    long-lived instance rather than building its own. Clients are keyed by
+    token because each one sends its token on every request.
+    """
+    client = _shared_clients.get(token)
+    if client is None or client.is_closed:
+        client = _shared_clients[token] = create_http_client(token)
+    return client
+
+
+async def aclose_shared_client() -> None:
+    """Close every process-wide API client that was created."""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+# One upstream semaphore per event loop; asyncio primitives are loop-bound
+_upstream_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _upstream_semaphore() -> asyncio.Semaphore:
+    """Return the running loop's limiter for in-flight Sensor Tower requests."""
+    loop = asyncio.get_running_loop()
+    semaphore = _upstream_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _upstream_semaphores[loop] = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+    return semaphore
+
+
+# Raw response bodies are cached so every hit decodes into fresh objects;
+# values are (fresh_until, stale_until, body) on the monotonic clock
+_response_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, float, bytes]]" = OrderedDict()
+# Fetches run as their own tasks so cancelling one caller never cancels the
+# request other callers (or a background refresh) are waiting on
+_inflight_responses: Dict[Tuple[Any, ...], "asyncio.Task[bytes]"] = {}
+# Optional second level behind _response_cache for endpoints with a positive TTL
+_response_store: Optional[ResponseStore] = (
+    ResponseStore(RESPONSE_CACHE_PATH) if RESPONSE_CACHE_PATH else None
+)
+
+# Calls waiting to be merged into one multi-app request, keyed by their shared params
+_pending_batches: Dict[Tuple[Any, ...], List[Tuple[List[str], "asyncio.Future[Any]"]]] = {}
+_flush_tasks: set = set()
+
+
+@lru_cache(maxsize=128)
+def _response_ttl(endpoint: str) -> float:
+    """Return the cache lifetime for ``endpoint``, or 0 when it is not cached."""
+    return RESPONSE_CACHE_TTLS.get(endpoint.split("/", 3)[-1], 0.0)
+
+
+def _response_cache_key(token: str, endpoint: str, params: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    # Subscription-gated SDK data is never cached
+    if params.get("include_sdk_data"):
+        return None
+    try:
+        return (token, endpoint, tuple(sorted(params.items())))
+    except TypeError:
+        return None
+
+
+def _drop_empty_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``params`` without ``None``/empty values, copying only when needed."""
+    for value in params.values():
+        if value is None or value == "" or value == []:
+            return {
+                key: value
+                for key, value in params.items()
+                if not (value is None or value == "" or value == [])
+            }
+    return params
+
+
+def clear_response_cache() -> None:
+    """Drop every in-memory cached API response."""
+    _response_cache.clear()
+
+
+def close_response_store() -> None:
+    """Close the on-disk response store; it reopens on next use."""
+    if _response_store is not None:
+        _response_store.close()
+
+
 class SensorTowerTool:
     """Base class for Sensor Tower API tools"""
     
-    def __init__(self, client: httpx.AsyncClient, token: str):
-        self.client = client
+    def __init__(self, client: Optional[httpx.AsyncClient], token: str):
+        self._client = client
         self.token = token
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for API calls; defaults to the shared process-wide client."""
+        if self._client is not None:
+            return self._client
+        return get_shared_client(self.token)
+
+    async def aclose(self) -> None:
+        """Close the client this tool group was given.
+
+        Shared clients serve every tool group and are left open; the server
+        closes them with ``aclose_shared_client`` at shutdown.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "SensorTowerTool":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
     
     def get_auth_token(self) -> str:
         """Get authentication token"""
         return self.token
     
-    async def make_request(self, endpoint: str, params: Dict[str, Any]) -> Any:
-        """Make authenticated request to Sensor Tower API with retries and backoff."""
-        params["auth_token"] = self.get_auth_token()
+    async def make_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        *,
+        stream: Optional[bool] = None,
+    ) -> Any:
+        """Make authenticated request to Sensor Tower API with retries and backoff.
+
+        The auth token is a default query parameter on clients built by
+        ``config.create_http_client``; any other client gets it added per
+        request (see ``_auth_params``). ``params`` is never mutated; ``None`` and
+        empty-string values are left out of the query string.
+        ``stream`` defaults to True for endpoints in ``STREAMED_ENDPOINT_SUFFIXES``.
+        Successful responses from endpoints in ``RESPONSE_CACHE_TTLS`` are reused
+        until they expire (empty ones for at most ``_NEGATIVE_CACHE_TTL``), and
+        identical concurrent calls to them share one request.
+        Shortly after expiry a cached response is still returned while a
+        background request refreshes it.
+        """
+        if stream is None:
+            stream = endpoint.endswith(STREAMED_ENDPOINT_SUFFIXES)
+        params = _drop_empty_params(params)
+
+        ttl = _response_ttl(endpoint)
+        # Streamed bodies are never buffered, so they bypass the cache entirely;
+        # uncached endpoints go direct so a cancelled caller cancels its request
+        cache_key = (
+            None if stream or not ttl else _response_cache_key(self.token, endpoint, params)
+        )
+        if cache_key is None:
+            return await self._request_with_retries(endpoint, params, stream)
+
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            fresh_until, stale_until, content = cached
+            now = time.monotonic()
+            if now < stale_until:
+                _response_cache.move_to_end(cache_key)
+                if now >= fresh_until:
+                    self._schedule_refresh(cache_key, endpoint, params, ttl)
+                return json_loads(content)
+            del _response_cache[cache_key]
+
+        # Single-flight: concurrent identical calls share one upstream request
+        pending = _inflight_responses.get(cache_key)
+        if pending is None:
+            pending = self._start_fetch(cache_key, endpoint, params, ttl)
+        return json_loads(await asyncio.shield(pending))
+
+    def _schedule_refresh(
+        self, cache_key: Tuple[Any, ...], endpoint: str, params: Dict[str, Any], ttl: float
+    ) -> None:
+        """Refresh a stale cache entry in the background, at most once per key."""
+        # A failed refresh leaves the stale entry until its grace period ends
+        if cache_key not in _inflight_responses:
+            self._start_fetch(cache_key, endpoint, params, ttl)
+
+    def _start_fetch(
+        self, cache_key: Tuple[Any, ...], endpoint: str, params: Dict[str, Any], ttl: float
+    ) -> "asyncio.Task[bytes]":
+        """Run the shared fetch for ``cache_key`` in a task of its own."""
+        task = asyncio.ensure_future(self._fetch_into_cache(cache_key, endpoint, params, ttl))
+        _inflight_responses[cache_key] = task
+
+        def _done(task: "asyncio.Task[bytes]") -> None:
+            if _inflight_responses.get(cache_key) is task:
+                del _inflight_responses[cache_key]
+            # Mark the exception retrieved when no caller was waiting
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _fetch_into_cache(
+        self, cache_key: Tuple[Any, ...], endpoint: str, params: Dict[str, Any], ttl: float
+    ) -> bytes:
+        """Fetch ``endpoint``, cache the response body and return it undecoded."""
+        grace = ttl * _STALE_GRACE_FACTOR
+        stored = None
+        if _response_store is not None:
+            stored = await asyncio.to_thread(_response_store.get, ResponseStore.key_for(cache_key))
+        if stored is not None:
+            ttl, content = stored
+        else:
+            content = await self._request_with_retries(endpoint, params, False, raw=True)
+
+        if content.strip() in _EMPTY_BODIES:
+            # Empty answers may just not be published yet, so recheck them sooner
+            ttl = min(ttl, _NEGATIVE_CACHE_TTL)
+            grace = 0.0
+        elif stored is None and _response_store is not None:
+            await asyncio.to_thread(
+                _response_store.put, ResponseStore.key_for(cache_key), ttl, content
+            )
+        fresh_until = time.monotonic() + ttl
+        _response_cache[cache_key] = (fresh_until, fresh_until + grace, content)
+        _response_cache.move_to_end(cache_key)
+        if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+        return content
+
+    async def _request_with_retries(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        stream: bool,
+        *,
+        raw: bool = False,
+    ) -> Any:
+        """GET ``endpoint`` with jittered exponential backoff on transient errors.
+
+        Returns the decoded JSON body, or the undecoded bytes when ``raw`` is set.
+        """
+        params = self._auth_params(params)
         backoff_seconds = 0.5
-        max_attempts = 5
-        for attempt_index in range(max_attempts):
+        for attempt_index in range(_MAX_ATTEMPTS):
             try:
-                response = await self.client.get(endpoint, params=params)
+                # Hold a slot only for the request itself, not the backoff sleep
+                async with _upstream_semaphore():
+                    if stream:
+                        return await self._get_streamed(endpoint, params)
+                    response = await self.client.get(endpoint, params=params)
                 response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as status_error:
-                status_code = status_error.response.status_code
-                if status_code in {429, 500, 502, 503, 504} and attempt_index < (max_attempts - 1):
-                    await asyncio.sleep(backoff_seconds)
-                    backoff_seconds = min(backoff_seconds * 2.0, 8.0)
-                    continue
-                raise
-            except (httpx.ReadTimeout, httpx.ConnectError):
-                if attempt_index < (max_attempts - 1):
-                    await asyncio.sleep(backoff_seconds)
-                    backoff_seconds = min(backoff_seconds * 2.0, 8.0)
-                    continue
-                raise
+                if raw:
+                    return response.content
+                return json_loads(response.content)
+            except (httpx.HTTPStatusError, httpx.ReadTimeout, httpx.ConnectError) as error:
+                if not _should_retry(error, attempt_index):
+                    raise
+                # Full jitter keeps concurrent callers from retrying in lockstep
+                delay = random.uniform(0, backoff_seconds)
+                if isinstance(error, httpx.HTTPStatusError):
+                    delay = max(_retry_after_seconds(error.response), delay)
+                await asyncio.sleep(delay)
+                backoff_seconds = min(backoff_seconds * 2.0, 8.0)
+
+    def _auth_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add ``auth_token`` unless the client already sends this tool's token."""
+        client_params = getattr(self.client, "params", None)
+        if client_params is not None and client_params.get("auth_token") == self.token:
+            return params
+        return {**params, "auth_token": self.token}
+
+    async def _get_streamed(self, endpoint: str, params: Dict[str, Any]) -> Any:
+        """GET an endpoint and decode its JSON body as the chunks arrive."""
+        async with self.client.stream("GET", endpoint, params=params) as response:
+            if response.is_error:
+                # Load error bodies so HTTPStatusError consumers can read them
+                await response.aread()
+            response.raise_for_status()
+            return await json_loads_stream(response.aiter_bytes())
+
+    async def make_batched_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        id_key: str,
+        batch_size: int,
+    ) -> Any:
+        """Split ``params[id_key]`` into API-sized batches and fetch them concurrently.
+
+        Calls within ``batch_size`` go out as a single request. Larger ID lists
+        are issued ``batch_size`` IDs at a time (at most ``_BATCH_CONCURRENCY``
+        in flight) and the responses are merged with ``merge_batched_results``.
+        """
+
+        ids = [value.strip() for value in str(params[id_key]).split(",") if value.strip()]
+        if len(ids) <= batch_size:
+            return await self.make_request(endpoint, params)
+
+        semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+        async def fetch(batch: List[str]) -> Any:
+            async with semaphore:
+                return await self.make_request(endpoint, {**params, id_key: ",".join(batch)})
+
+        results = await asyncio.gather(
+            *(fetch(ids[start:start + batch_size]) for start in range(0, len(ids), batch_size))
+        )
+        return merge_batched_results(results)
+
+    async def make_coalesced_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        id_key: str = "app_ids",
+    ) -> Any:
+        """Merge concurrent calls that differ only in ``params[id_key]``.
+
+        Calls arriving within ``COALESCE_WINDOW_SECONDS`` of each other are sent
+        as one request (up to ``_COALESCE_MAX_IDS`` IDs) and each caller gets the
+        rows for its own apps. Calls whose exact request is already cached or in
+        flight are answered from there without waiting. See ``_flush_coalesced``
+        for the fallback when rows cannot be attributed to apps.
+        """
+
+        ids = [value.strip() for value in str(params.get(id_key) or "").split(",") if value.strip()]
+        if COALESCE_WINDOW_SECONDS <= 0 or not ids or len(ids) >= _COALESCE_MAX_IDS:
+            return await self.make_request(endpoint, params)
+
+        shared = _drop_empty_params({key: value for key, value in params.items() if key != id_key})
+        try:
+            key = (self.token, endpoint, id_key, tuple(sorted(shared.items())))
+        except TypeError:
+            return await self.make_request(endpoint, params)
+
+        # Answers already cached or in flight skip the coalescing window
+        own_params = {**shared, id_key: ",".join(ids)}
+        own_key = _response_cache_key(self.token, endpoint, own_params)
+        cached = _response_cache.get(own_key)
+        if (cached is not None and cached[1] > time.monotonic()) or own_key in _inflight_responses:
+            return await self.make_request(endpoint, own_params)
+
+        future = asyncio.get_running_loop().create_future()
+        batch = _pending_batches.get(key)
+        if batch is None:
+            batch = _pending_batches[key] = []
+            task = asyncio.ensure_future(self._flush_coalesced(key, endpoint, shared, id_key))
+            _flush_tasks.add(task)
+            task.add_done_callback(_flush_tasks.discard)
+        batch.append((ids, future))
+        return await future
+
+    async def _flush_coalesced(
+        self,
+        key: Tuple[Any, ...],
+        endpoint: str,
+        shared: Dict[str, Any],
+        id_key: str,
+    ) -> None:
+        """Send one request for a coalescing window and hand rows back to callers.
+
+        Each caller gets its apps' rows in response order. A caller falls back to
+        its own request when the merged request fails, when the response is not
+        a list of per-app records, or when some of its IDs match no row.
+        """
+
+        await asyncio.sleep(COALESCE_WINDOW_SECONDS)
+        batch = _pending_batches.pop(key, [])
+        waiters = [(ids, future) for ids, future in batch if not future.done()]
+        if not waiters:
+            return
+
+        async def fetch_alone(ids: List[str]) -> Any:
+            return await self.make_request(endpoint, {**shared, id_key: ",".join(ids)})
+
+        async def deliver(ids: List[str], future: "asyncio.Future[Any]") -> None:
+            try:
+                result = await fetch_alone(ids)
+            except Exception as error:  # handed to the waiting caller
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+        all_ids = list(dict.fromkeys(app_id for ids, _ in waiters for app_id in ids))
+        if len(waiters) == 1 or len(all_ids) > _COALESCE_MAX_IDS:
+            await asyncio.gather(*(deliver(ids, future) for ids, future in waiters))
+            return
+
+        try:
+            response = await fetch_alone(all_ids)
+        except Exception:
+            # One caller's bad ID, or the larger merged request, must not fail the rest
+            await asyncio.gather(*(deliver(ids, future) for ids, future in waiters))
+            return
+
+        row_app_ids = _row_app_ids(response)
+        fallback = waiters if row_app_ids is None else []
+        if row_app_ids is not None:
+            returned = set(row_app_ids)
+            for ids, future in waiters:
+                if not returned.issuperset(ids):
+                    # The API may spell IDs differently; ask for these apps directly
+                    fallback.append((ids, future))
+                elif not future.done():
+                    wanted = set(ids)
+                    future.set_result(
+                        [row for row, app_id in zip(response, row_app_ids) if app_id in wanted]
+                    )
+        await asyncio.gather(*(deliver(ids, future) for ids, future in fallback))
 
     def build_meta(
         self,
@@ -125,58 +600,32 @@ class SensorTowerTool:
         *,
         title: Optional[str] = None,
         **hints: Any,
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Create standardized annotations for a tool decorator."""
 
-        resolved_title = title or _to_title(tool_name)
+        resolved_title = title or TOOL_TITLES.get(tool_name) or _to_title(tool_name)
         return build_tool_annotations(title=resolved_title, **hints)
 
-    def create_task(self, coro, *, list_metadata: Optional[Dict[str, Any]] = None):
-        """Create asyncio task for synchronous tool interface.
-
-        FastMCP tools expect structured (dict-like) payloads. Wrapping the coroutine
-        allows us to normalize list responses across every tool without changing
-        the individual implementations.
-        """
-
-        async def _runner():
-            try:
-                raw_result = await coro
-                return self.normalize_result(raw_result, list_metadata)
-            except asyncio.CancelledError:
-                # Allow upstream to handle cancellation cleanly
-                raise
-
-        return asyncio.create_task(_runner())
-
     def normalize_result(
         self, result: Any, metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Coerce tool results into dictionaries compatible with MCP clients."""
 
+        # Payload keys are listed last so metadata never overwrites them.
         if isinstance(result, dict):
             if metadata:
-                # Metadata keys should not overwrite the main payload.
-                merged = {**result}
-                for key, value in metadata.items():
-                    merged.setdefault(key, value)
-                return merged
+                return {**metadata, **result}
             return result
 
         if isinstance(result, list):
-            payload: Dict[str, Any] = {
-                "items": result,
-                "total_count": len(result),
-            }
             if metadata:
-                payload.update({k: v for k, v in metadata.items() if k not in payload})
-            return payload
+                return {**metadata, "items": result, "total_count": len(result)}
+            return {"items": result, "total_count": len(result)}
 
         # Fallback for primitives/None – wrap so FastMCP receives a mapping.
-        wrapped: Dict[str, Any] = {"value": result}
         if metadata:
-            wrapped.update({k: v for k, v in metadata.items() if k not in wrapped})
-        return wrapped
+            return {**metadata, "value": result}
+        return {"value": result}
 
     def _attach_metadata(self, tool: Any, tool_name: str) -> None:
         """Enrich a registered tool with example metadata for downstream tests."""
@@ -190,7 +639,7 @@ class SensorTowerTool:
         description: Optional[str] = None,
         title: Optional[str] = None,
         category: Optional[str] = None,
-        annotations: Optional[Dict[str, Any]] = None,
+        annotations: Optional[Mapping[str, Any]] = None,
         meta: Optional[Dict[str, Any]] = None,
     ) -> Callable[[Callable[..., Awaitable[Any]]], Any]:
         """Helper that registers an async tool with consistent metadata handling."""
@@ -208,27 +657,23 @@ class SensorTowerTool:
 
             # Enrich the description with metadata guidance so tooling consumers
             # always see an example or usage note alongside the terse docstring.
-            doc_parts = [base_description.strip()]
-            if isinstance(resolved_meta, dict):
-                docs_meta = resolved_meta.get("docs")
-                if isinstance(docs_meta, dict):
-                    hint = docs_meta.get("hint")
-                    if hint:
-                        normalized_hint = hint.strip()
-                        if not normalized_hint.lower().startswith("note:"):
-                            normalized_hint = f"Note: {normalized_hint}"
-                        doc_parts.append(normalized_hint)
-                    example = docs_meta.get("example_snippet")
-                    if example:
-                        doc_parts.append(f"Example: {example}")
-
-            func_description = "\n\n".join(part for part in doc_parts if part)
+            if not meta:
+                suffix = _DOC_SUFFIXES.get(name, "")
+            else:
+                docs_meta = meta.get("docs") if isinstance(meta, dict) else None
+                suffix = format_docs_suffix(docs_meta) if isinstance(docs_meta, dict) else ""
+
+            func_description = base_description.strip() + suffix
 
             @wraps(func)
             async def runner(*args: Any, **kwargs: Any) -> Dict[str, Any]:
                 result = func(*args, **kwargs)
-                if inspect.isawaitable(result):
+                # Tools are async def, so the exact-type check settles almost every call
+                if type(result) is CoroutineType or inspect.isawaitable(result):
                     result = await result  # type: ignore[assignment]
+                # Tools that already normalized (or returned a mapping) pass through.
+                if isinstance(result, dict):
+                    return result
                 return self.normalize_result(result)
 
             runner.__doc__ = func_description
@@ -243,15 +688,33 @@ class SensorTowerTool:
         return decorator
 
 
-def build_tool_metadata(tool_name: str) -> Dict[str, Any]:
-    """Create structured metadata with example arguments for the given tool."""
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def format_example_snippet(tool_name: str, arguments: Dict[str, Any]) -> str:
+    """Format a concise example call snippet for metadata and documentation."""
+    if not arguments:
+        return f"{tool_name}()"
+
+    formatted_args = ", ".join(f"{key}={value!r}" for key, value in arguments.items())
+    return f"{tool_name}({formatted_args})"
+
+
+@lru_cache(maxsize=None)
+def build_tool_metadata(tool_name: str) -> Mapping[str, Any]:
+    """Create structured metadata with example arguments for the given tool.
+
+    TOOL_ARGUMENT_EXAMPLES is static, so results are cached and returned as
+    read-only mappings. Nested values are shared between callers; deep-copy
+    before handing them to code that may mutate them.
+    """
     record = TOOL_ARGUMENT_EXAMPLES.get(tool_name)
     if not record:
-        return {}
+        return _EMPTY_METADATA
 
     if record.get("skip_reason"):
         # Skip entries that are intentionally disabled (e.g., connected apps).
-        return {"docs": {"hint": record["skip_reason"]}}
+        return MappingProxyType({"docs": {"hint": record["skip_reason"]}})
 
     arguments = record.get("arguments", {})
     example_snippet = format_example_snippet(tool_name, arguments)
@@ -259,13 +722,75 @@ def build_tool_metadata(tool_name: str) -> Dict[str, Any]:
         "Invoke with representative arguments shown below; see documentation for other options."
     )
 
-    return {
+    return MappingProxyType({
         "docs": {
             "hint": hint,
             "example_arguments": arguments,
             "example_snippet": example_snippet,
         }
-    }
+    })
+
+
+def format_docs_suffix(docs_meta: Mapping[str, Any]) -> str:
+    """Render docs metadata as the note/example text appended to descriptions."""
+    parts = []
+    hint = docs_meta.get("hint")
+    if hint:
+        normalized_hint = hint.strip()
+        if not normalized_hint.lower().startswith("note:"):
+            normalized_hint = f"Note: {normalized_hint}"
+        parts.append(normalized_hint)
+    example = docs_meta.get("example_snippet")
+    if example:
+        parts.append(f"Example: {example}")
+    return "".join(f"\n\n{part}" for part in parts)
+
+
+# Description suffixes for every tool with an examples record, rendered once.
+_DOC_SUFFIXES: Dict[str, str] = {
+    name: format_docs_suffix(build_tool_metadata(name).get("docs", {}))
+    for name in TOOL_ARGUMENT_EXAMPLES
+}
+
+
+def merge_batched_results(results: List[Any]) -> Any:
+    """Combine per-batch responses into the shape of a single response.
+
+    Lists are concatenated. Dicts keep the first batch's scalar values and
+    concatenate list values under the same key. Anything else is returned
+    as the list of batch results.
+    """
+
+    if all(isinstance(result, list) for result in results):
+        return [item for result in results for item in result]
+    if all(isinstance(result, dict) for result in results):
+        merged = dict(results[0])
+        for result in results[1:]:
+            for key, value in result.items():
+                if isinstance(value, list) and isinstance(merged.get(key), list):
+                    merged[key] = merged[key] + value
+                else:
+                    merged.setdefault(key, value)
+        return merged
+    return list(results)
+
+
+def _row_app_ids(response: Any) -> Optional[List[str]]:
+    """Return the app ID of each record in a per-app list, or None if impossible."""
+
+    if not isinstance(response, list):
+        return None
+    app_ids: List[str] = []
+    for row in response:
+        if not isinstance(row, dict):
+            return None
+        for field in _APP_ID_FIELDS:
+            if field in row:
+                app_ids.append(str(row[field]))
+                break
+        else:
+            return None
+    return app_ids
 
 
 def apply_tool_metadata(tool: Any, tool_name: str) -> None:
@@ -275,16 +800,9 @@ def apply_tool_metadata(tool: Any, tool_name: str) -> None:
         return
 
     existing_meta = getattr(tool, "meta", {}) or {}
-    setattr(tool, "meta", {**existing_meta, **metadata})
-
+    # Each tool gets its own copy so edits to its meta never reach the cache
+    setattr(tool, "meta", {**existing_meta, **copy.deepcopy(dict(metadata))})
 
-def format_example_snippet(tool_name: str, arguments: Dict[str, Any]) -> str:
-    """Format a concise example call snippet for metadata and documentation."""
-    if not arguments:
-        return f"{tool_name}()"
-
-    formatted_args = ", ".join(f"{key}={value!r}" for key, value in arguments.items())
-    return f"{tool_name}({formatted_args})"
 
 def wrap_list_response(data: Any, metadata: Dict[str, Any]) -> Dict[str, Any]:
     """Wrap raw list responses in dictionary structure for MCP compliance"""
@@ -297,22 +815,42 @@ def wrap_list_response(data: Any, metadata: Dict[str, Any]) -> Dict[str, Any]:
     else:
         return data
 
-def validate_os_parameter(os: str, allowed: list = None) -> str:
-    """Validate operating system parameter"""
-    if allowed is None:
-        allowed = ["ios", "android", "unified"]
-    
+def validate_os_parameter(os: str, allowed: Optional[Iterable[str]] = None) -> str:
+    """Validate operating system parameter before it is interpolated into a URL.
+
+    ``allowed`` defaults to ios, android and unified; pass a tuple literal for
+    narrower sets so no container is built per call.
+    """
     normalized = os.lower()
-    if normalized not in allowed:
-        raise ToolError(f"Invalid OS parameter: {os}. Must be one of: {', '.join(allowed)}")
+    if allowed is None:
+        if normalized in _DEFAULT_OS:
+            return normalized
+        allowed_message = _DEFAULT_OS_MESSAGE
+    elif normalized in allowed:
+        return normalized
+    else:
+        allowed_message = ", ".join(allowed)
 
-    return normalized
+    raise ToolError(f"Invalid OS parameter: {os}. Must be one of: {allowed_message}")
 
 def validate_date_format(date_str: str) -> str:
     """Validate date format (YYYY-MM-DD)"""
-    from datetime import datetime
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return date_str
-    except ValueError as exc:
-        raise ToolError(f"Invalid date format: {date_str}. Must be YYYY-MM-DD") from exc
+    match = _DATE_RE.fullmatch(date_str)
+    if match:
+        year, month, day = match.groups()
+        try:
+            # Shape is already known; only calendar validity is left to check
+            date(int(year), int(month), int(day))
+            return date_str
+        except ValueError:
+            pass
+    raise ToolError(f"Invalid date format: {date_str}. Must be YYYY-MM-DD")
+
+
+def validate_countries(countries: str) -> str:
+    """Validate a comma-separated list of two-letter country codes"""
+    if _COUNTRIES_RE.fullmatch(countries.replace(" ", "")):
+        return countries
+    raise ToolError(
+        f"Invalid countries: {countries}. Must be comma-separated two-letter codes such as US,GB"
+    )
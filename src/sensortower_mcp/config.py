@@ -4,9 +4,10 @@ Configuration and setup for Sensor Tower MCP Server
 """
 
 import argparse
+import asyncio
 import os
 import httpx
-from typing import Optional
+from typing import Any, Coroutine, Optional
 
 # Try to load .env file if available
 try:
@@ -18,6 +19,30 @@ except ImportError:
 # Base configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "https://api.sensortower.com")
 
+# Sensor Tower JSON compresses well; httpx only advertises gzip/deflate by default
+ACCEPT_ENCODING = "br, gzip, deflate"
+
+# Connection pool sizing for the shared Sensor Tower client
+HTTP_MAX_CONNECTIONS = int(os.getenv("ST_HTTPX_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("ST_HTTPX_MAX_KEEPALIVE_CONNECTIONS", "20"))
+
+# Upstream Sensor Tower requests allowed in flight at once across all tools
+UPSTREAM_CONCURRENCY = int(os.getenv("ST_UPSTREAM_CONCURRENCY", "10"))
+
+# Concurrent runs allowed per tool on the legacy JSON invoke endpoint
+TOOL_CONCURRENCY = int(os.getenv("ST_TOOL_CONCURRENCY", "16"))
+
+# How long to gather concurrent per-app calls into one request (0 disables)
+COALESCE_WINDOW_SECONDS = float(os.getenv("ST_COALESCE_WINDOW_MS", "15")) / 1000.0
+
+# SQLite file that keeps cached API responses across restarts (unset disables)
+RESPONSE_CACHE_PATH = os.getenv("ST_RESPONSE_CACHE_PATH") or None
+
+# Browser origins allowed over HTTP; empty disables CORS, "*" allows any origin
+CORS_ORIGINS = tuple(
+    origin.strip() for origin in os.getenv("ST_CORS_ORIGINS", "").split(",") if origin.strip()
+)
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="Sensor Tower MCP Server")
@@ -51,9 +76,34 @@ def create_http_client(token: str) -> httpx.AsyncClient:
     """Create HTTP client for Sensor Tower API"""
     return httpx.AsyncClient(
         base_url=API_BASE_URL,
+        params={"auth_token": token},
+        headers={"Accept-Encoding": ACCEPT_ENCODING},
+        http2=True,
+        # Keep idle connections around as long as typical nginx keep-alive so
+        # bursts of tool calls reuse them instead of re-handshaking
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=75.0,
+        ),
         timeout=httpx.Timeout(connect=5.0, read=45.0, write=45.0, pool=5.0)
     )
 
+def install_eager_task_factory() -> None:
+    """Run new tasks eagerly on Python 3.12+ so tools that finish without
+    suspending never pay for Task scheduling. No-op on older interpreters."""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+def run_event_loop(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``main`` to completion on uvloop when installed, else on asyncio."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
+
 def validate_token(token: Optional[str] = None) -> bool:
     """Validate that we have a token available"""
     try:
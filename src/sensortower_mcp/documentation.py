@@ -5,24 +5,9 @@ Documentation resources for Sensor Tower MCP Server
 
 from fastmcp import FastMCP
 
-def register_documentation(mcp: FastMCP):
-    """Register documentation resources with FastMCP"""
-    @mcp.resource("sensor-tower://info")
-    def server_info() -> dict:
-        """Basic server info for MCP clients."""
-        from .config import API_BASE_URL
-        return {
-            "name": "Sensor Tower MCP Server",
-            "version": "1.2.x",
-            "transport": "stdio/http",
-            "api_base_url": API_BASE_URL,
-            "tool_count": 40,
-        }
-    
-    @mcp.resource("sensor-tower://docs")
-    def api_documentation() -> str:
-        """Provides comprehensive documentation about available Sensor Tower API endpoints."""
-        return """
+from .config import API_BASE_URL
+
+API_DOCUMENTATION = """
         # Sensor Tower MCP Server Documentation
         
         ## Available Tools:
@@ -98,10 +83,7 @@ def register_documentation(mcp: FastMCP):
         - **data_model**: "DM_2025_Q2" (new model) or "DM_2025_Q1" (legacy)
         """
 
-    @mcp.resource("sensor-tower://examples")
-    def usage_examples() -> str:
-        """Provides practical usage examples for common Sensor Tower API scenarios."""
-        return """
+USAGE_EXAMPLES = """
         # Sensor Tower API Usage Examples
         
         ## 1. App Research Workflow
@@ -201,3 +183,26 @@ def register_documentation(mcp: FastMCP):
         - Dates must be in YYYY-MM-DD format
         - App IDs: iOS uses numbers, Android uses package names
         """
+
+def register_documentation(mcp: FastMCP):
+    """Register documentation resources with FastMCP"""
+    @mcp.resource("sensor-tower://info")
+    def server_info() -> dict:
+        """Basic server info for MCP clients."""
+        return {
+            "name": "Sensor Tower MCP Server",
+            "version": "1.2.x",
+            "transport": "stdio/http",
+            "api_base_url": API_BASE_URL,
+            "tool_count": 40,
+        }
+    
+    @mcp.resource("sensor-tower://docs")
+    def api_documentation() -> str:
+        """Provides comprehensive documentation about available Sensor Tower API endpoints."""
+        return API_DOCUMENTATION
+
+    @mcp.resource("sensor-tower://examples")
+    def usage_examples() -> str:
+        """Provides practical usage examples for common Sensor Tower API scenarios."""
+        return USAGE_EXAMPLES
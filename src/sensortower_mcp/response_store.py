@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+SQLite-backed response store that lets cached API responses survive restarts
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+from .serialization import json_dumps
+
+
+class ResponseStore:
+    """Persist raw response bodies with a wall-clock expiry.
+
+    Keys are hashed before they reach disk so auth tokens are never stored.
+    Methods are blocking; call them through ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def key_for(cache_key: Tuple[Any, ...]) -> str:
+        return hashlib.sha256(json_dumps([str(part) for part in cache_key])).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, body BLOB NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        """Return ``(seconds_left, body)`` for a live entry, else None."""
+        now = time.time()
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT expires_at, body FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0] - now, bytes(row[1])
+
+    def put(self, key: str, ttl: float, body: bytes) -> None:
+        """Store ``body`` for ``ttl`` seconds and drop rows that have expired."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            # Indexed, so this only touches the rows it removes
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, body) VALUES (?, ?, ?)",
+                (key, now + ttl, body),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+JSON helpers that prefer orjson and fall back to the standard library
+"""
+
+import json
+from typing import Any, AsyncIterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional "stream" extra
+    ijson = None
+
+
+def json_loads(data: bytes) -> Any:
+    """Decode a UTF-8 JSON document from raw response bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class _ChunkReader:
+    """Expose an async byte-chunk iterator through the ``read`` API ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+
+    async def read(self, size: int = -1) -> bytes:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def json_loads_stream(chunks: AsyncIterator[bytes]) -> Any:
+    """Decode a JSON document from a stream of byte chunks.
+
+    With ijson installed the document is built while chunks arrive, so the raw
+    body is never held in full next to the decoded objects. Without it the
+    chunks are joined and decoded in one go.
+    """
+    if ijson is not None:
+        async for document in ijson.items_async(_ChunkReader(chunks), "", use_float=True):
+            return document
+        raise ValueError("Empty JSON response body")
+    return json_loads(b"".join([chunk async for chunk in chunks]))
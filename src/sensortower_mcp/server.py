@@ -3,28 +3,137 @@
 Main server module for Sensor Tower MCP Server
 """
 
+import asyncio
 import sys
+import threading
 from fastmcp import FastMCP
+from fastmcp.exceptions import NotFoundError
 from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
+from .base import aclose_shared_client, close_response_store, get_shared_client
 from .config import (
-    parse_args, validate_token, create_http_client, 
-    print_startup_info, print_token_error, get_auth_token
-)
-from .tools import (
-    AppAnalysisTools, StoreMarketingTools, MarketAnalysisTools,
-    YourMetricsTools, SearchDiscoveryTools, UtilityTools
+    API_BASE_URL, CORS_ORIGINS, TOOL_CONCURRENCY, parse_args,
+    print_startup_info, print_token_error, get_auth_token,
+    install_eager_task_factory, run_event_loop
 )
+from . import tools
 from .documentation import register_documentation
 from .prompts import register_prompts
+from .serialization import json_dumps, json_loads
+
+try:
+    from starlette.middleware.cors import CORSMiddleware
+except ImportError:  # pragma: no cover - CORS is best-effort
+    CORSMiddleware = None
+
+class FastJSONResponse(Response):
+    """JSON response rendered with the shared orjson-backed encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return json_dumps(content)
+
+
+def _serialize_blocks(content) -> list:
+    """Dump tool content blocks to JSON-compatible values.
+
+    Results are usually a list of one content block type, so ``model_dump``
+    is resolved once on that type instead of once per block.
+    """
+    if not content:
+        return []
+    block_type = type(content[0])
+    if all(type(block) is block_type for block in content):
+        dump = getattr(block_type, "model_dump", None)
+        if dump is None:
+            return list(content)
+        return [dump(block, mode="json") for block in content]
+    return [
+        block.model_dump(mode="json") if hasattr(block, "model_dump") else block
+        for block in content
+    ]
+
 
 # Global variables for deferred initialization
 sensor_tower_client = None
 
+
+# Accept header values that FastMCP's HTTP transport rejects on /mcp routes
+_TRIGGER_ACCEPTS = frozenset((b"application/json", b"*/*", b""))
+_FIXED_ACCEPT = b"application/json, text/event-stream"
+_MCP_PREFIX = "/mcp"
+_MCP_PREFIX_LEN = len(_MCP_PREFIX)
+
+# Upper bound on tools memoized by the legacy JSON endpoint
+_TOOL_CACHE_SIZE = 256
+
+
+class ClaudeDesktopFixMiddleware:
+    """ASGI middleware that adds text/event-stream to bare MCP Accept headers.
+
+    Works on the raw ASGI scope so responses (including SSE streams) pass
+    through untouched and no Request objects are built per call.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Only process MCP endpoint requests (e.g. /mcp, /mcp/tools/invoke)
+        if scope["type"] != "http" or scope["path"][:_MCP_PREFIX_LEN] != _MCP_PREFIX:
+            await self.app(scope, receive, send)
+            return
+
+        headers = scope["headers"]
+        for index, (name, value) in enumerate(headers):
+            if name == b"accept":
+                # If clients only send application/json (or */*) add text/event-stream
+                if value in _TRIGGER_ACCEPTS:
+                    fixed = headers[:index] + [(b"accept", _FIXED_ACCEPT)] + headers[index + 1:]
+                    scope = {**scope, "headers": fixed}
+                break
+        else:
+            scope = {**scope, "headers": [*headers, (b"accept", _FIXED_ACCEPT)]}
+
+        await self.app(scope, receive, send)
+
+
+class HealthShortCircuit:
+    """Outermost ASGI middleware that answers ``GET /health`` without routing."""
+
+    def __init__(self, app, body: bytes):
+        self.app = app
+        self._body = body
+        self._headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/health" and scope["method"] == "GET":
+            await send({"type": "http.response.start", "status": 200, "headers": self._headers})
+            await send({"type": "http.response.body", "body": self._body})
+            return
+        await self.app(scope, receive, send)
+
+
 class SensorTowerMCPServer:
     """Main MCP Server class for Sensor Tower"""
+
+    __slots__ = (
+        "args",
+        "mcp",
+        "client",
+        "tools_registered",
+        "_registration_lock",
+        "_tool_cache",
+        "_tool_semaphores",
+        "_health_body",
+    )
     
     def __init__(self):
         self.args = parse_args()
@@ -35,15 +144,23 @@ class SensorTowerMCPServer:
         )
         self.client = None
         self.tools_registered = False
+        self._registration_lock = threading.Lock()
+        # Resolved tools for the legacy JSON endpoint, cleared on registration
+        self._tool_cache = {}
+        # Per-tool limits so one slow tool cannot drain the shared HTTP pool
+        self._tool_semaphores = {}
+        self._health_body = b""
         
     def setup_client(self):
         """Initialize HTTP client and validate token"""
-        if not validate_token(self.args.token):
+        # Resolve the token once; a ValueError means none was configured
+        try:
+            token = get_auth_token(self.args.token)
+        except ValueError:
             print_token_error()
             sys.exit(1)
-            
-        token = get_auth_token(self.args.token)
-        self.client = create_http_client(token)
+
+        self.client = get_shared_client(token)
         
         # Set global client for backward compatibility
         global sensor_tower_client
@@ -53,24 +170,31 @@ class SensorTowerMCPServer:
     
     def register_all_tools(self, token: str):
         """Register all MCP tools and resources"""
-        if self.tools_registered:
-            return
-            
+        # Registration is synchronous, so a thread lock is enough to keep
+        # concurrent callers from racing into on_duplicate_tools="error"
+        with self._registration_lock:
+            if self.tools_registered:
+                return
+            self._register_all_tools(token)
+            self._tool_cache.clear()
+            self.tools_registered = True
+
+    def _register_all_tools(self, token: str):
         # Initialize all tool classes
-        app_analysis = AppAnalysisTools(self.client, token)
-        store_marketing = StoreMarketingTools(self.client, token)
-        market_analysis = MarketAnalysisTools(self.client, token)
-        your_metrics = YourMetricsTools(self.client, token)
-        search_discovery = SearchDiscoveryTools(self.client, token)
-        utilities = UtilityTools()
-        
-        # Register tools with FastMCP
-        app_analysis.register_tools(self.mcp)
-        store_marketing.register_tools(self.mcp)
-        market_analysis.register_tools(self.mcp)
-        your_metrics.register_tools(self.mcp)
-        search_discovery.register_tools(self.mcp)
-        utilities.register_tools(self.mcp)
+        tool_groups = (
+            tools.AppAnalysisTools(self.client, token),
+            tools.StoreMarketingTools(self.client, token),
+            tools.MarketAnalysisTools(self.client, token),
+            tools.YourMetricsTools(self.client, token),
+            tools.SearchDiscoveryTools(self.client, token),
+            tools.UtilityTools(),
+        )
+
+        # Register tools with FastMCP. This stays serial: FastMCP's tool
+        # manager is not thread-safe and schema generation holds the GIL,
+        # so worker threads would add locking without overlapping any work.
+        for tool_group in tool_groups:
+            tool_group.register_tools(self.mcp)
         
         # Register documentation resources
         register_documentation(self.mcp)
@@ -81,92 +205,54 @@ class SensorTowerMCPServer:
         self.add_health_endpoint()
         self.add_json_tool_endpoint()
 
-        # Fix FastMCP HTTP transport parameter validation bug
-        if self.args.transport == "http":
-            self.patch_fastmcp_http_transport()
-        
-        self.tools_registered = True
-    
-    def patch_fastmcp_http_transport(self):
-        """Add middleware to fix Claude Desktop Accept header compatibility"""
-        # FastMCP 2.11.1 HTTP transport is too strict about Accept headers
-        # This middleware fixes the issue before requests reach FastMCP
-        
-        from starlette.middleware.base import BaseHTTPMiddleware
-        from starlette.requests import Request
-        
-        class ClaudeDesktopFixMiddleware(BaseHTTPMiddleware):
-            async def dispatch(self, request: Request, call_next):
-                # Only process MCP endpoint requests (e.g. /mcp, /mcp/tools/invoke)
-                if request.url.path.startswith('/mcp'):
-                    # Fix Accept header for Claude Desktop compatibility
-                    headers = dict(request.headers)
-                    accept_header = headers.get('accept', '')
-                    
-                    # If clients only send application/json (or */*) add text/event-stream
-                    if accept_header in {'application/json', '*/*', ''}:
-                        # Create new headers with both mime types
-                        new_headers = []
-                        accept_set = False
-                        for name, value in request.headers.items():
-                            if name.lower() == 'accept':
-                                new_headers.append((name.encode(), b"application/json, text/event-stream"))
-                                accept_set = True
-                            else:
-                                new_headers.append((name.encode(), value.encode()))
-                        
-                        if not accept_set:
-                            new_headers.append((b"accept", b"application/json, text/event-stream"))
-
-                        # Create new scope with fixed headers
-                        scope = request.scope.copy()
-                        scope['headers'] = new_headers
-                        
-                        # Create new request with fixed headers
-                        from starlette.requests import Request as NewRequest
-                        fixed_request = NewRequest(scope, request.receive)
-                        
-                        return await call_next(fixed_request)
-                
-                return await call_next(request)
-        
-        # Add the middleware to FastMCP's FastAPI app
-        if hasattr(self.mcp, '_app'):
-            self.mcp._app.add_middleware(ClaudeDesktopFixMiddleware)
-            try:
-                from starlette.middleware.cors import CORSMiddleware
-                self.mcp._app.add_middleware(
-                    CORSMiddleware,
-                    allow_origins=["*"],
-                    allow_methods=["*"],
-                    allow_headers=["*"]
-                )
-            except Exception:
-                # CORS is best-effort and only relevant for browser-based callers
-                pass
+    def http_middleware(self):
+        """ASGI middleware for FastMCP's HTTP app, outermost first.
+
+        FastMCP builds its Starlette app per run, so the stack is handed to
+        ``run_async(middleware=...)`` / ``http_app(middleware=...)`` rather
+        than patched onto an existing app.
+        """
+        # Health probes skip the whole stack below
+        middleware = [Middleware(HealthShortCircuit, body=self._health_body)]
+        # CORS only matters for browser callers, so it is opt-in via ST_CORS_ORIGINS
+        if CORS_ORIGINS and CORSMiddleware is not None:
+            middleware.append(Middleware(
+                CORSMiddleware,
+                allow_origins=list(CORS_ORIGINS),
+                allow_methods=["*"],
+                allow_headers=["*"]
+            ))
+        # FastMCP's HTTP transport is too strict about Accept headers for
+        # Claude Desktop; fix them before requests reach FastMCP
+        middleware.append(Middleware(ClaudeDesktopFixMiddleware))
+        return middleware
+
+    def http_app(self):
+        """Build FastMCP's Starlette app with the server's middleware installed"""
+        return self.mcp.http_app(middleware=self.http_middleware())
 
     def add_health_endpoint(self):
         """Add HTTP health check endpoint"""
+        # The payload is static for the life of the process, so encode it once
+        body = self._health_body = json_dumps({
+            "status": "healthy",
+            "service": "Sensor Tower MCP Server",
+            "transport": self.args.transport,
+            "api_base_url": API_BASE_URL,
+            "tools_available": 40
+        })
+
         @self.mcp.custom_route("/health", methods=["GET"])
-        async def health_endpoint(request: Request) -> JSONResponse:
+        async def health_endpoint(request: Request) -> Response:
             """HTTP health check endpoint"""
-            from .config import API_BASE_URL
-            return JSONResponse({
-                "status": "healthy",
-                "service": "Sensor Tower MCP Server", 
-                "transport": self.args.transport,
-                "api_base_url": API_BASE_URL,
-                "tools_available": 40
-            })
+            return Response(body, media_type="application/json")
 
     def add_json_tool_endpoint(self):
         """Add legacy JSON endpoint that bypasses JSON-RPC session handling."""
 
-        from fastmcp.exceptions import NotFoundError
-
         @self.mcp.custom_route("/legacy/tools/invoke", methods=["POST"])
-        async def invoke_tool(request: Request) -> JSONResponse:
-            payload = await request.json()
+        async def invoke_tool(request: Request) -> FastJSONResponse:
+            payload = json_loads(await request.body())
             tool_name = payload.get("tool")
             arguments = payload.get("arguments") or {}
 
@@ -175,34 +261,54 @@ class SensorTowerMCPServer:
             if not isinstance(arguments, dict):
                 raise HTTPException(status_code=400, detail="Tool arguments must be an object")
 
-            try:
-                tool = await self.mcp.get_tool(tool_name)
-            except NotFoundError as exc:  # pragma: no cover - runtime check
-                raise HTTPException(status_code=404, detail=str(exc)) from exc
+            tool = self._tool_cache.get(tool_name)
+            if tool is None:
+                try:
+                    tool = await self.mcp.get_tool(tool_name)
+                except NotFoundError as exc:  # pragma: no cover - runtime check
+                    raise HTTPException(status_code=404, detail=str(exc)) from exc
+                if len(self._tool_cache) >= _TOOL_CACHE_SIZE:
+                    self._tool_cache.clear()
+                self._tool_cache[tool_name] = tool
+
+            semaphore = self._tool_semaphores.get(tool_name)
+            if semaphore is None:
+                semaphore = self._tool_semaphores[tool_name] = asyncio.Semaphore(TOOL_CONCURRENCY)
 
             try:
-                result = await tool.run(arguments)
+                async with semaphore:
+                    result = await tool.run(arguments)
             except Exception as exc:  # pragma: no cover - runtime failure
                 raise HTTPException(status_code=500, detail=f"Tool execution failed: {exc}") from exc
 
             structured = getattr(result, "structured_content", None)
             if structured is None:
                 content = getattr(result, "content", [])
-
-                def serialize(block):
-                    if hasattr(block, "model_dump"):
-                        return block.model_dump(mode="json")
-                    return block
-
-                structured = [serialize(block) for block in content]
+                structured = _serialize_blocks(content)
 
             response_body = {
                 "tool": tool_name,
                 "result": structured,
             }
 
-            return JSONResponse(response_body)
+            return FastJSONResponse(response_body)
     
+    async def _serve(self, **transport_kwargs):
+        """Run FastMCP on the current event loop with loop-level tuning applied"""
+        install_eager_task_factory()
+        try:
+            await self.mcp.run_async(**transport_kwargs)
+        finally:
+            await self._on_shutdown()
+
+    async def _on_shutdown(self):
+        """Release pooled connections while the loop that owns them is alive"""
+        global sensor_tower_client
+        await aclose_shared_client()
+        close_response_store()
+        self.client = None
+        sensor_tower_client = None
+
     async def run_async(self):
         """Run server in async mode"""
         # Setup client and register tools
@@ -215,16 +321,17 @@ class SensorTowerMCPServer:
         try:
             if self.args.transport == "stdio":
                 # Run in stdio mode for MCP clients
-                await self.mcp.run_async()
+                await self._serve()
             elif self.args.transport == "http":
                 # Run in HTTP mode using FastMCP's built-in HTTP server
                 print(f"🌐 Starting HTTP server on http://localhost:{self.args.port}")
                 print(f"🔍 Health check: http://localhost:{self.args.port}/health")
                 
-                await self.mcp.run_async(
+                await self._serve(
                     transport="http",
                     host="0.0.0.0",
-                    port=self.args.port
+                    port=self.args.port,
+                    middleware=self.http_middleware()
                 )
         except KeyboardInterrupt:
             print("\n👋 Shutting down Sensor Tower MCP Server")
@@ -245,17 +352,18 @@ class SensorTowerMCPServer:
         try:
             if self.args.transport == "stdio":
                 # Run in stdio mode for MCP clients - use synchronous run
-                self.mcp.run()
+                run_event_loop(self._serve())
             else:
                 # For HTTP mode, use FastMCP's built-in HTTP server
                 print(f"🌐 Starting HTTP server on http://localhost:{self.args.port}")
                 print(f"🔍 Health check: http://localhost:{self.args.port}/health")
                 
-                self.mcp.run(
+                run_event_loop(self._serve(
                     transport="http",
                     host="0.0.0.0",
-                    port=self.args.port
-                )
+                    port=self.args.port,
+                    middleware=self.http_middleware()
+                ))
         except KeyboardInterrupt:
             print("\n👋 Shutting down Sensor Tower MCP Server")
             sys.exit(0)
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 """
 Sensor Tower MCP Tools Package
+
+Tool classes are imported on first access (PEP 562) so entry points that
+never register tools, such as ``--help``, skip loading every tool module.
 """
 
-from .app_analysis import AppAnalysisTools
-from .store_marketing import StoreMarketingTools  
-from .market_analysis import MarketAnalysisTools
-from .your_metrics import YourMetricsTools
-from .search_discovery import SearchDiscoveryTools
-from .utilities import UtilityTools
+import importlib
+
+_LAZY_IMPORTS = {
+    "AppAnalysisTools": ".app_analysis",
+    "StoreMarketingTools": ".store_marketing",
+    "MarketAnalysisTools": ".market_analysis",
+    "YourMetricsTools": ".your_metrics",
+    "SearchDiscoveryTools": ".search_discovery",
+    "UtilityTools": ".utilities",
+}
 
 __all__ = [
     "AppAnalysisTools",
@@ -17,4 +24,18 @@ __all__ = [
     "YourMetricsTools",
     "SearchDiscoveryTools",
     "UtilityTools"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,128 @@
 #!/usr/bin/env python3
 """App Analysis API tools for Sensor Tower MCP Server."""
 
+import time
+from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Annotated, Literal, Optional, Union
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
-from ..base import SensorTowerTool, validate_date_format, validate_os_parameter
+from ..base import (
+    SensorTowerTool,
+    validate_countries,
+    validate_date_format,
+    validate_os_parameter,
+)
+
+# Ad networks accepted by the ad intel endpoints, and lowercase aliases for them
+_VALID_NETWORKS = frozenset({
+    "Adcolony",
+    "Admob",
+    "Applovin",
+    "Chartboost",
+    "Instagram",
+    "Mopub",
+    "Pinterest",
+    "Snapchat",
+    "Supersonic",
+    "Tapjoy",
+    "TikTok",
+    "Unity",
+    "Vungle",
+    "Youtube",
+})
+_NETWORK_MAPPING = MappingProxyType({
+    "unity": "Unity",
+    "google": "Youtube",
+    "youtube": "Youtube",
+    "admob": "Admob",
+    "applovin": "Applovin",
+    "chartboost": "Chartboost",
+    "instagram": "Instagram",
+    "snapchat": "Snapchat",
+    "tiktok": "TikTok",
+    "mopub": "Mopub",
+    "tapjoy": "Tapjoy",
+    "vungle": "Vungle",
+    "pinterest": "Pinterest",
+    "adcolony": "Adcolony",
+    "supersonic": "Supersonic",
+})
+
+# Lowercase names the ad intel endpoints reject; they are dropped silently
+_BLOCKED_NETWORKS = frozenset({"facebook"})
+
+# Case-insensitive lookup to the canonical network name; None marks blocked
+# networks and unknown names pass through unchanged
+_NETWORK_CANONICAL = MappingProxyType({
+    **{network.lower(): network for network in _VALID_NETWORKS},
+    **_NETWORK_MAPPING,
+    **dict.fromkeys(_BLOCKED_NETWORKS),
+})
+
+
+@lru_cache(maxsize=512)
+def _normalize_networks(networks: str) -> str:
+    """Canonicalize a comma-separated network list for the ad intel endpoints."""
+    normalized = []
+    for value in networks.split(","):
+        network = value.strip()
+        if network:
+            canonical = _NETWORK_CANONICAL.get(network.lower(), network)
+            if canonical is not None:
+                normalized.append(canonical)
+    return ",".join(normalized)
+
+
+@lru_cache(maxsize=1024)
+def _canonical_csv(value: str, upper: bool = False) -> str:
+    """Strip, dedupe and sort a comma-separated list so equal queries share a cache key."""
+    items = (item.strip() for item in value.split(","))
+    return ",".join(sorted({item.upper() if upper else item for item in items if item}))
+
+
+def _strip_csv(value: str) -> str:
+    """Drop whitespace and empty items from a comma-separated list, keeping order."""
+    # Well-formed input is returned as-is without splitting
+    if not (
+        " " in value
+        or "\t" in value
+        or ",," in value
+        or value.startswith(",")
+        or value.endswith(",")
+    ):
+        return value
+    return ",".join(item for item in (part.strip() for part in value.split(",")) if item)
+
+
+_EPOCH = date(1970, 1, 1)
+
+
+@lru_cache(maxsize=1)
+def _today_iso(day: int) -> str:
+    """Return the UTC calendar date for a ``time.time() // 86400`` day bucket."""
+    return (_EPOCH + timedelta(days=day)).isoformat()
+
+
+_PERIOD_MAPPING = {
+    "daily": "day",
+    "weekly": "week",
+    "monthly": "month",
+}
+
+
+# Parameter specs shared by several tools below
+_START_DATE_FIELD = Field(description="Start date in YYYY-MM-DD format")
+_END_DATE_FIELD = Field(description="End date in YYYY-MM-DD format")
+_APP_IDS_FIELD = Field(description="Comma-separated app IDs", min_length=1)
+_COUNTRIES_FIELD = Field(description="Comma-separated ISO country codes")
+_COUNTRY_FIELD = Field(description="ISO 3166-1 alpha-2 country code", min_length=2, max_length=2)
+_APP_ID_FIELD = Field(description="Single app identifier", min_length=1)
+_DATA_MODEL_FIELD = Field(description="Data model version")
 
 
 class AppAnalysisTools(SensorTowerTool):
@@ -15,6 +130,46 @@ class AppAnalysisTools(SensorTowerTool):
 
     category = "AppAnalysis"
 
+    async def _fetch_sales_report(
+        self,
+        os: str,
+        app_ids: str,
+        start_date: str,
+        end_date: str,
+        countries: Optional[str],
+        date_granularity: str,
+        data_model: str,
+    ) -> dict:
+        """Fetch sales_report_estimates, which carries both downloads and revenue.
+
+        The download and revenue tools send identical requests through here, so
+        one response (cached and single-flight in ``make_request``) serves both.
+        Concurrent calls for different apps are merged into one request.
+        """
+
+        os_value = validate_os_parameter(os)
+        start_value = validate_date_format(start_date)
+        end_value = validate_date_format(end_date)
+
+        canonical_app_ids = _canonical_csv(app_ids)
+        if not canonical_app_ids:
+            raise ToolError("app_ids must include at least one app identifier")
+
+        params = {
+            "app_ids": canonical_app_ids,
+            "start_date": start_value,
+            "end_date": end_value,
+            "date_granularity": date_granularity,
+            "data_model": data_model,
+        }
+        if countries:
+            params["countries"] = _canonical_csv(validate_countries(countries), upper=True)
+
+        return await self.make_coalesced_request(
+            f"/v1/{os_value}/sales_report_estimates",
+            params,
+        )
+
     def register_tools(self, mcp: FastMCP) -> None:
         """Register all app analysis tools with FastMCP."""
         
@@ -34,19 +189,21 @@ class AppAnalysisTools(SensorTowerTool):
             ],
             country: Annotated[
                 str,
-                Field(description="ISO 3166-1 alpha-2 country code", min_length=2, max_length=2),
+                _COUNTRY_FIELD,
             ] = "US",
         ) -> dict:
             """Retrieve top in-app purchases for the requested app IDs."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {
                 "app_ids": app_ids,
                 "country": country,
             }
-            return await self.make_request(
+            return await self.make_batched_request(
                 f"/v1/{os_value}/apps/top_in_app_purchases",
                 params,
+                "app_ids",
+                100,
             )
 
         @self.tool(
@@ -63,10 +220,10 @@ class AppAnalysisTools(SensorTowerTool):
                 str,
                 Field(description="Comma-separated app IDs to return creatives for", min_length=1),
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
             countries: Annotated[
                 str,
-                Field(description="Comma-separated ISO country codes"),
+                _COUNTRIES_FIELD,
             ],
             networks: Annotated[
                 str,
@@ -83,62 +240,16 @@ class AppAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Fetch advertising creatives for apps with Share of Voice and publisher data."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(start_date)
             end_value = validate_date_format(end_date) if end_date else None
 
-            valid_networks = {
-                "Adcolony",
-                "Admob",
-                "Applovin",
-                "Chartboost",
-                "Instagram",
-                "Mopub",
-                "Pinterest",
-                "Snapchat",
-                "Supersonic",
-                "Tapjoy",
-                "TikTok",
-                "Unity",
-                "Vungle",
-                "Youtube",
-            }
-            network_mapping = {
-                "unity": "Unity",
-                "google": "Youtube",
-                "youtube": "Youtube",
-                "admob": "Admob",
-                "applovin": "Applovin",
-                "chartboost": "Chartboost",
-                "instagram": "Instagram",
-                "snapchat": "Snapchat",
-                "tiktok": "TikTok",
-                "mopub": "Mopub",
-                "tapjoy": "Tapjoy",
-                "vungle": "Vungle",
-                "pinterest": "Pinterest",
-                "adcolony": "Adcolony",
-                "supersonic": "Supersonic",
-            }
-
-            normalized_networks: list[str] = []
-            for network in (value.strip() for value in networks.split(",") if value.strip()):
-                normalized = None
-                if network in valid_networks:
-                    normalized = network
-                elif network.lower() in network_mapping:
-                    normalized = network_mapping[network.lower()]
-
-                if normalized and normalized in valid_networks:
-                    normalized_networks.append(normalized)
-                elif network.lower() != "facebook":
-                    normalized_networks.append(network)
 
             params = {
                 "app_ids": app_ids,
                 "start_date": start_value,
-                "countries": countries,
-                "networks": ",".join(normalized_networks),
+                "countries": validate_countries(countries),
+                "networks": _normalize_networks(networks),
                 "ad_types": ad_types,
             }
             if end_value:
@@ -163,11 +274,11 @@ class AppAnalysisTools(SensorTowerTool):
                 str,
                 Field(description="Comma-separated app IDs (max 5 per call)", min_length=1),
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
-            end_date: Annotated[str, Field(description="End date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
+            end_date: Annotated[str, _END_DATE_FIELD],
             countries: Annotated[
                 str,
-                Field(description="Comma-separated ISO country codes"),
+                _COUNTRIES_FIELD,
             ],
             networks: Annotated[
                 str,
@@ -180,74 +291,26 @@ class AppAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get advertising impressions data for apps."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(start_date)
             end_value = validate_date_format(end_date)
-            period = {
-                "daily": "day",
-                "weekly": "week",
-                "monthly": "month",
-            }[date_granularity]
-
-            valid_networks = {
-                "Adcolony",
-                "Admob",
-                "Applovin",
-                "Chartboost",
-                "Instagram",
-                "Mopub",
-                "Pinterest",
-                "Snapchat",
-                "Supersonic",
-                "Tapjoy",
-                "TikTok",
-                "Unity",
-                "Vungle",
-                "Youtube",
-            }
-            network_mapping = {
-                "unity": "Unity",
-                "google": "Youtube",
-                "youtube": "Youtube",
-                "admob": "Admob",
-                "applovin": "Applovin",
-                "chartboost": "Chartboost",
-                "instagram": "Instagram",
-                "snapchat": "Snapchat",
-                "tiktok": "TikTok",
-                "mopub": "Mopub",
-                "tapjoy": "Tapjoy",
-                "vungle": "Vungle",
-                "pinterest": "Pinterest",
-                "adcolony": "Adcolony",
-                "supersonic": "Supersonic",
-            }
+            period = _PERIOD_MAPPING[date_granularity]
 
-            normalized_networks: list[str] = []
-            for network in (value.strip() for value in networks.split(',') if value.strip()):
-                normalized = None
-                if network in valid_networks:
-                    normalized = network
-                elif network.lower() in network_mapping:
-                    normalized = network_mapping[network.lower()]
-
-                if normalized and normalized in valid_networks:
-                    normalized_networks.append(normalized)
-                elif network.lower() != "facebook":
-                    normalized_networks.append(network)
 
             params = {
                 "app_ids": app_ids,
                 "start_date": start_value,
                 "end_date": end_value,
                 "period": period,
-                "countries": countries,
-                "networks": ','.join(normalized_networks),
+                "countries": validate_countries(countries),
+                "networks": _normalize_networks(networks),
             }
 
-            return await self.make_request(
+            return await self.make_batched_request(
                 f"/v1/{os_value}/ad_intel/network_analysis",
                 params,
+                "app_ids",
+                5,
             )
 
 
@@ -265,8 +328,8 @@ class AppAnalysisTools(SensorTowerTool):
                 str,
                 Field(description="Comma-separated app IDs (max 500 per call)", min_length=1),
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
-            end_date: Annotated[str, Field(description="End date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
+            end_date: Annotated[str, _END_DATE_FIELD],
             countries: Annotated[
                 str,
                 Field(description="Comma-separated ISO country codes (use WW for worldwide)"),
@@ -282,28 +345,26 @@ class AppAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get usage intelligence active users data."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(start_date)
             end_value = validate_date_format(end_date)
 
-            time_period = {
-                "daily": "day",
-                "weekly": "week",
-                "monthly": "month",
-            }[date_granularity]
+            time_period = _PERIOD_MAPPING[date_granularity]
 
             params = {
                 "app_ids": app_ids,
                 "start_date": start_value,
                 "end_date": end_value,
-                "countries": countries,
+                "countries": validate_countries(countries),
                 "time_period": time_period,
                 "data_model": data_model,
             }
 
-            return await self.make_request(
+            return await self.make_batched_request(
                 f"/v1/{os_value}/usage/active_users",
                 params,
+                "app_ids",
+                500,
             )
 
         @self.tool(
@@ -318,7 +379,7 @@ class AppAnalysisTools(SensorTowerTool):
             ],
             app_ids: Annotated[
                 str,
-                Field(description="Comma-separated app IDs", min_length=1),
+                _APP_IDS_FIELD,
             ],
             category: Annotated[
                 Union[int, str],
@@ -328,24 +389,20 @@ class AppAnalysisTools(SensorTowerTool):
                 str,
                 Field(description="Comma-separated chart type identifiers", min_length=1),
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
-            end_date: Annotated[str, Field(description="End date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
+            end_date: Annotated[str, _END_DATE_FIELD],
             countries: Annotated[
                 str,
-                Field(description="Comma-separated ISO country codes"),
+                _COUNTRIES_FIELD,
             ] = "US",
         ) -> dict:
             """Get category ranking history for apps."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(start_date)
             end_value = validate_date_format(end_date)
 
-            normalized_chart_types = ",".join(
-                value.strip()
-                for value in chart_type_ids.split(",")
-                if value.strip()
-            )
+            normalized_chart_types = _strip_csv(chart_type_ids)
             if not normalized_chart_types:
                 raise ToolError("chart_type_ids must include at least one chart type identifier")
 
@@ -355,7 +412,7 @@ class AppAnalysisTools(SensorTowerTool):
                 "chart_type_ids": normalized_chart_types,
                 "start_date": start_value,
                 "end_date": end_value,
-                "countries": countries,
+                "countries": validate_countries(countries),
             }
 
             return await self.make_request(
@@ -373,8 +430,8 @@ class AppAnalysisTools(SensorTowerTool):
                 Literal["ios", "android"],
                 Field(description="Operating system for the compact sales report"),
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
-            end_date: Annotated[str, Field(description="End date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
+            end_date: Annotated[str, _END_DATE_FIELD],
             app_ids: Annotated[
                 Optional[str],
                 Field(description="Comma-separated app IDs", default=None),
@@ -397,7 +454,7 @@ class AppAnalysisTools(SensorTowerTool):
             ] = None,
             countries: Annotated[
                 str,
-                Field(description="Comma-separated ISO country codes"),
+                _COUNTRIES_FIELD,
             ] = "US",
             date_granularity: Annotated[
                 Literal["daily", "weekly", "monthly", "quarterly"],
@@ -405,34 +462,34 @@ class AppAnalysisTools(SensorTowerTool):
             ] = "daily",
             data_model: Annotated[
                 Literal["DM_2025_Q2", "DM_2025_Q1"],
-                Field(description="Data model version"),
+                _DATA_MODEL_FIELD,
             ] = "DM_2025_Q2",
         ) -> dict:
             """Get download and revenue estimates in compact format."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             start_value = validate_date_format(start_date)
             end_value = validate_date_format(end_date)
 
             params = {
                 "start_date": start_value,
                 "end_date": end_value,
-                "countries": countries,
+                "countries": validate_countries(countries),
                 "date_granularity": date_granularity,
                 "data_model": data_model,
             }
 
-            optional_params = {
-                "app_ids": app_ids,
-                "publisher_ids": publisher_ids,
-                "unified_app_ids": unified_app_ids,
-                "unified_publisher_ids": unified_publisher_ids,
-                "categories": categories,
-            }
-
-            for key, value in optional_params.items():
-                if value:
-                    params[key] = value
+            params.update(
+                (key, value)
+                for key, value in (
+                    ("app_ids", app_ids),
+                    ("publisher_ids", publisher_ids),
+                    ("unified_app_ids", unified_app_ids),
+                    ("unified_publisher_ids", unified_publisher_ids),
+                    ("categories", categories),
+                )
+                if value
+            )
 
             return await self.make_request(
                 f"/v1/{os_value}/compact_sales_report_estimates",
@@ -449,15 +506,15 @@ class AppAnalysisTools(SensorTowerTool):
                 Literal["ios", "android"],
                 Field(description="Operating system for category summary"),
             ],
-            app_id: Annotated[str, Field(description="Single app identifier", min_length=1)],
+            app_id: Annotated[str, _APP_ID_FIELD],
             country: Annotated[
                 str,
-                Field(description="ISO 3166-1 alpha-2 country code", min_length=2, max_length=2),
+                _COUNTRY_FIELD,
             ],
         ) -> dict:
             """Get today's category ranking summary for a particular app."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {
                 "app_id": app_id,
                 "country": country,
@@ -480,13 +537,13 @@ class AppAnalysisTools(SensorTowerTool):
             ],
             app_ids: Annotated[
                 str,
-                Field(description="Comma-separated app IDs", min_length=1),
+                _APP_IDS_FIELD,
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
-            end_date: Annotated[str, Field(description="End date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
+            end_date: Annotated[str, _END_DATE_FIELD],
             countries: Annotated[
                 str,
-                Field(description="Comma-separated ISO country codes"),
+                _COUNTRIES_FIELD,
             ],
             networks: Annotated[
                 Optional[str],
@@ -495,7 +552,7 @@ class AppAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get advertising impressions rank data for apps."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(start_date)
             end_value = validate_date_format(end_date)
 
@@ -503,7 +560,7 @@ class AppAnalysisTools(SensorTowerTool):
                 "app_ids": app_ids,
                 "start_date": start_value,
                 "end_date": end_value,
-                "countries": countries,
+                "countries": validate_countries(countries),
                 "period": "day",
             }
             if networks:
@@ -514,11 +571,15 @@ class AppAnalysisTools(SensorTowerTool):
                 params,
             )
 
-            metadata = {}
             if isinstance(response, list):
-                metadata["summary"] = f"Retrieved {len(response)} rank data points"
+                count = len(response)
+                return {
+                    "summary": f"Retrieved {count} rank data points",
+                    "items": response,
+                    "total_count": count,
+                }
 
-            return self.normalize_result(response, metadata)
+            return self.normalize_result(response)
 
         @self.tool(
             mcp,
@@ -532,13 +593,13 @@ class AppAnalysisTools(SensorTowerTool):
             ],
             app_ids: Annotated[
                 str,
-                Field(description="Comma-separated app IDs", min_length=1),
+                _APP_IDS_FIELD,
             ],
             date_granularity: Annotated[
                 Literal["daily", "weekly", "monthly"],
                 Field(description="Time granularity for retention metrics"),
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
             end_date: Annotated[
                 Optional[str],
                 Field(description="End date in YYYY-MM-DD format", default=None),
@@ -550,9 +611,11 @@ class AppAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get retention analysis data for apps."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(start_date)
-            actual_end_value = validate_date_format(end_date) if end_date else "2024-01-31"
+            actual_end_value = (
+                validate_date_format(end_date) if end_date else _today_iso(int(time.time()) // 86400)
+            )
 
             params = {
                 "app_ids": app_ids,
@@ -584,10 +647,10 @@ class AppAnalysisTools(SensorTowerTool):
             ],
             countries: Annotated[
                 str,
-                Field(description="Comma-separated ISO country codes"),
+                _COUNTRIES_FIELD,
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
-            end_date: Annotated[str, Field(description="End date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
+            end_date: Annotated[str, _END_DATE_FIELD],
             date_granularity: Annotated[
                 Literal["daily", "weekly", "monthly", "quarterly"],
                 Field(description="Granularity for download sources"),
@@ -595,13 +658,13 @@ class AppAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get app downloads by sources (organic, paid, browser)."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(start_date)
             end_value = validate_date_format(end_date)
 
             params = {
                 "app_ids": app_ids,
-                "countries": countries,
+                "countries": validate_countries(countries),
                 "start_date": start_value,
                 "end_date": end_value,
                 "date_granularity": date_granularity,
@@ -624,13 +687,13 @@ class AppAnalysisTools(SensorTowerTool):
             ],
             app_ids: Annotated[
                 str,
-                Field(description="Comma-separated app IDs", min_length=1),
+                _APP_IDS_FIELD,
             ],
             date_granularity: Annotated[
                 Literal["daily", "weekly", "monthly"],
                 Field(description="Granularity for demographic aggregation"),
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
             end_date: Annotated[
                 Optional[str],
                 Field(description="End date in YYYY-MM-DD format", default=None),
@@ -642,9 +705,11 @@ class AppAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get demographic analysis data for apps."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(start_date)
-            actual_end_value = validate_date_format(end_date) if end_date else "2024-01-31"
+            actual_end_value = (
+                validate_date_format(end_date) if end_date else _today_iso(int(time.time()) // 86400)
+            )
 
             params = {
                 "app_ids": app_ids,
@@ -670,10 +735,10 @@ class AppAnalysisTools(SensorTowerTool):
                 Literal["ios", "android"],
                 Field(description="Operating system for the app"),
             ],
-            app_id: Annotated[str, Field(description="Single app identifier", min_length=1)],
+            app_id: Annotated[str, _APP_ID_FIELD],
             country: Annotated[
                 str,
-                Field(description="ISO 3166-1 alpha-2 country code", min_length=2, max_length=2),
+                _COUNTRY_FIELD,
             ] = "US",
             date_limit: Annotated[
                 int,
@@ -682,7 +747,7 @@ class AppAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get app update history timeline."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {
                 "app_id": app_id,
                 "country": country,
@@ -704,15 +769,15 @@ class AppAnalysisTools(SensorTowerTool):
                 Literal["ios", "android"],
                 Field(description="Operating system for the app"),
             ],
-            app_id: Annotated[str, Field(description="Single app identifier", min_length=1)],
+            app_id: Annotated[str, _APP_ID_FIELD],
             country: Annotated[
                 str,
-                Field(description="ISO 3166-1 alpha-2 country code", min_length=2, max_length=2),
+                _COUNTRY_FIELD,
             ] = "US",
         ) -> dict:
             """Get version history for a particular app."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {
                 "app_id": app_id,
                 "country": country,
@@ -739,7 +804,7 @@ class AppAnalysisTools(SensorTowerTool):
             ],
             country: Annotated[
                 str,
-                Field(description="ISO 3166-1 alpha-2 country code", min_length=2, max_length=2),
+                _COUNTRY_FIELD,
             ] = "US",
             include_sdk_data: Annotated[
                 bool,
@@ -748,16 +813,18 @@ class AppAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get comprehensive app metadata including descriptions, ratings, and more."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {
                 "app_ids": app_ids,
                 "country": country,
                 "include_sdk_data": include_sdk_data,
             }
 
-            return await self.make_request(
+            return await self.make_batched_request(
                 f"/v1/{os_value}/apps",
                 params,
+                "app_ids",
+                100,
             )
 
         @self.tool(
@@ -772,10 +839,10 @@ class AppAnalysisTools(SensorTowerTool):
             ],
             app_ids: Annotated[
                 str,
-                Field(description="Comma-separated app IDs", min_length=1),
+                _APP_IDS_FIELD,
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
-            end_date: Annotated[str, Field(description="End date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
+            end_date: Annotated[str, _END_DATE_FIELD],
             countries: Annotated[
                 Optional[str],
                 Field(description="Comma-separated ISO country codes", default=None),
@@ -786,28 +853,13 @@ class AppAnalysisTools(SensorTowerTool):
             ] = "daily",
             data_model: Annotated[
                 Literal["DM_2025_Q2", "DM_2025_Q1"],
-                Field(description="Data model version"),
+                _DATA_MODEL_FIELD,
             ] = "DM_2025_Q2",
         ) -> dict:
             """Fetch download estimates for apps by country and date."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
-            start_value = validate_date_format(start_date)
-            end_value = validate_date_format(end_date)
-
-            params = {
-                "app_ids": app_ids,
-                "start_date": start_value,
-                "end_date": end_value,
-                "date_granularity": date_granularity,
-                "data_model": data_model,
-            }
-            if countries:
-                params["countries"] = countries
-
-            return await self.make_request(
-                f"/v1/{os_value}/sales_report_estimates",
-                params,
+            return await self._fetch_sales_report(
+                os, app_ids, start_date, end_date, countries, date_granularity, data_model
             )
 
         @self.tool(
@@ -822,10 +874,10 @@ class AppAnalysisTools(SensorTowerTool):
             ],
             app_ids: Annotated[
                 str,
-                Field(description="Comma-separated app IDs", min_length=1),
+                _APP_IDS_FIELD,
             ],
-            start_date: Annotated[str, Field(description="Start date in YYYY-MM-DD format")],
-            end_date: Annotated[str, Field(description="End date in YYYY-MM-DD format")],
+            start_date: Annotated[str, _START_DATE_FIELD],
+            end_date: Annotated[str, _END_DATE_FIELD],
             countries: Annotated[
                 Optional[str],
                 Field(description="Comma-separated ISO country codes", default=None),
@@ -836,26 +888,11 @@ class AppAnalysisTools(SensorTowerTool):
             ] = "daily",
             data_model: Annotated[
                 Literal["DM_2025_Q2", "DM_2025_Q1"],
-                Field(description="Data model version"),
+                _DATA_MODEL_FIELD,
             ] = "DM_2025_Q2",
         ) -> dict:
             """Fetch revenue estimates for apps by country and date."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
-            start_value = validate_date_format(start_date)
-            end_value = validate_date_format(end_date)
-
-            params = {
-                "app_ids": app_ids,
-                "start_date": start_value,
-                "end_date": end_value,
-                "date_granularity": date_granularity,
-                "data_model": data_model,
-            }
-            if countries:
-                params["countries"] = countries
-
-            return await self.make_request(
-                f"/v1/{os_value}/sales_report_estimates",
-                params,
+            return await self._fetch_sales_report(
+                os, app_ids, start_date, end_date, countries, date_granularity, data_model
             )
@@ -79,7 +79,7 @@ class MarketAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get top apps by download or revenue estimates with growth metrics."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(date)
             end_value = validate_date_format(end_date) if end_date else None
 
@@ -161,7 +161,7 @@ class MarketAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get top publishers by download or revenue estimates."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(date)
             end_value = validate_date_format(end_date) if end_date else None
 
@@ -217,7 +217,7 @@ class MarketAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get app store summary statistics."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             start_value = validate_date_format(start_date)
             end_value = validate_date_format(end_date)
 
@@ -288,7 +288,7 @@ class MarketAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get top apps by active users with growth metrics."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             start_value = validate_date_format(date)
 
             params = {
@@ -343,7 +343,7 @@ class MarketAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Get top ranking apps for a category and chart type."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             date_value = validate_date_format(date)
 
             params = {
@@ -404,7 +404,7 @@ class MarketAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Fetch Share of Voice for top advertisers or publishers."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             date_value = validate_date_format(date)
 
             params = {
@@ -460,7 +460,7 @@ class MarketAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Fetch the rank of a top advertiser or publisher for the given filters."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             date_value = validate_date_format(date)
 
             valid_networks = {
@@ -585,7 +585,7 @@ class MarketAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Fetch top creatives over a given time period."""
 
-            os_value = validate_os_parameter(os, ["ios", "android", "unified"])
+            os_value = validate_os_parameter(os)
             date_value = validate_date_format(date)
 
             params = {
@@ -643,7 +643,7 @@ class MarketAnalysisTools(SensorTowerTool):
         ) -> dict:
             """Retrieve aggregated download and revenue estimates of game categories."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             start_value = validate_date_format(start_date)
             end_value = validate_date_format(end_date)
 
@@ -158,7 +158,7 @@ class SearchDiscoveryTools(SensorTowerTool):
         ) -> dict:
             """Retrieve app IDs by category and release/update date filters."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {
                 "category": category,
                 "limit": limit,
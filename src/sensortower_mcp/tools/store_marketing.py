@@ -112,7 +112,7 @@ class StoreMarketingTools(SensorTowerTool):
         ) -> dict:
             """Retrieve featured creatives and their positions over time."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {"app_id": app_id}
 
             optional_params = {
@@ -149,7 +149,7 @@ class StoreMarketingTools(SensorTowerTool):
         ) -> dict:
             """Get current keyword rankings for an app."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {
                 "app_id": app_id,
                 "country": country,
@@ -206,7 +206,7 @@ class StoreMarketingTools(SensorTowerTool):
         ) -> dict:
             """Get app reviews and ratings data."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {
                 "app_id": app_id,
                 "country": country,
@@ -257,7 +257,7 @@ class StoreMarketingTools(SensorTowerTool):
         ) -> dict:
             """Retrieve keyword research metadata including related terms and difficulty."""
 
-            os_value = validate_os_parameter(os, ["ios", "android"])
+            os_value = validate_os_parameter(os, ("ios", "android"))
             params = {
                 "term": term,
                 "country": country,
@@ -3,7 +3,7 @@
 Utility tools for Sensor Tower MCP Server
 """
 
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal, Mapping
 
 from fastmcp import FastMCP
 from pydantic import Field
@@ -32,7 +32,7 @@ class UtilityTools:
             **extra,
         )
 
-    def _annotations(self, tool_name: str, *, title: str | None = None) -> dict:
+    def _annotations(self, tool_name: str, *, title: str | None = None) -> Mapping[str, Any]:
         resolved_title = title or _titleize(tool_name)
         return build_tool_annotations(title=resolved_title)
 
@@ -1,10 +1,19 @@
 """Unit tests for app analysis tools specific behaviors."""
 
 import inspect
+import time
 
 import pytest
 
-from src.sensortower_mcp.tools.app_analysis import AppAnalysisTools
+from src.sensortower_mcp.tools.app_analysis import (
+    _BLOCKED_NETWORKS,
+    _NETWORK_MAPPING,
+    _VALID_NETWORKS,
+    AppAnalysisTools,
+    _canonical_csv,
+    _strip_csv,
+    _today_iso,
+)
 
 
 class _RecordingAppAnalysisTools(AppAnalysisTools):
@@ -18,6 +27,9 @@ class _RecordingAppAnalysisTools(AppAnalysisTools):
         self.last_request = (endpoint, params)
         return {"ok": True}
 
+    async def make_coalesced_request(self, endpoint: str, params: dict, id_key: str = "app_ids"):  # type: ignore[override]
+        return await self.make_request(endpoint, params)
+
 
 class _RegisteredTool:
     def __init__(self, fn):
@@ -95,3 +107,60 @@ async def test_get_category_history_normalizes_chart_types():
     assert endpoint.endswith("/category/category_history")
     assert params["category"] == "6005"
     assert params["chart_type_ids"] == "topfreeapplications,topgrossingapplications"
+
+
+@pytest.mark.asyncio
+async def test_get_impressions_normalizes_networks():
+    mock_mcp = _MockFastMCP()
+    tools = _RecordingAppAnalysisTools()
+    tools.register_tools(mock_mcp)
+
+    await mock_mcp.tools["get_impressions"](
+        os="ios",
+        app_ids="284882215",
+        start_date="2024-01-01",
+        end_date="2024-01-07",
+        countries="US",
+        networks=" google , Facebook,ADMOB,,Meta",
+    )
+
+    assert tools.last_request is not None
+    _, params = tools.last_request
+    assert params["networks"] == "Youtube,Admob,Meta"
+    assert params["period"] == "day"
+
+
+@pytest.mark.asyncio
+async def test_retention_defaults_end_date_to_today():
+    mock_mcp = _MockFastMCP()
+    tools = _RecordingAppAnalysisTools()
+    tools.register_tools(mock_mcp)
+
+    await mock_mcp.tools["app_analysis_retention"](
+        os="ios",
+        app_ids="284882215",
+        date_granularity="monthly",
+        start_date="2024-01-01",
+    )
+
+    assert tools.last_request is not None
+    _, params = tools.last_request
+    assert params["end_date"] == _today_iso(int(time.time()) // 86400)
+    assert _today_iso(19737) == "2024-01-15"
+
+
+def test_canonical_csv_collapses_equivalent_lists():
+    assert _canonical_csv("us, gb,US", upper=True) == _canonical_csv("GB,us", upper=True) == "GB,US"
+    assert _canonical_csv("com.b.app, com.a.app,,") == "com.a.app,com.b.app"
+
+
+def test_strip_csv_keeps_order_and_passes_clean_input_through():
+    clean = "topfreeapplications,topgrossingapplications"
+    assert _strip_csv(clean) is clean
+    assert _strip_csv(" b ,a,,") == "b,a"
+
+
+def test_network_aliases_map_to_valid_networks():
+    assert set(_NETWORK_MAPPING.values()) <= _VALID_NETWORKS
+    assert all(alias == alias.lower() for alias in _NETWORK_MAPPING)
+    assert not _BLOCKED_NETWORKS & set(_NETWORK_MAPPING)
@@ -0,0 +1,434 @@
+"""Unit tests for request helpers in sensortower_mcp.base."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastmcp.exceptions import ToolError
+
+from src.sensortower_mcp import base
+from src.sensortower_mcp.base import (
+    SensorTowerTool,
+    _response_cache,
+    _shared_clients,
+    _retry_after_seconds,
+    apply_tool_metadata,
+    build_tool_metadata,
+    clear_response_cache,
+    merge_batched_results,
+    validate_countries,
+    validate_date_format,
+)
+
+
+def test_retry_after_numeric_header_is_honored():
+    response = httpx.Response(429, headers={"Retry-After": "3"})
+    assert _retry_after_seconds(response) == 3.0
+
+
+def test_retry_after_missing_or_http_date_falls_back_to_zero():
+    assert _retry_after_seconds(httpx.Response(503)) == 0.0
+    dated = httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert _retry_after_seconds(dated) == 0.0
+
+
+def test_shared_clients_are_keyed_by_token():
+    first = SensorTowerTool(None, "token-a").client
+    second = SensorTowerTool(None, "token-b").client
+
+    assert first is not second
+    assert first.params["auth_token"] == "token-a"
+    assert second.params["auth_token"] == "token-b"
+    assert SensorTowerTool(None, "token-a").client is first
+    _shared_clients.clear()
+
+
+@pytest.mark.asyncio
+async def test_aclose_leaves_shared_clients_open():
+    shared = SensorTowerTool(None, "token-b").client
+
+    async with SensorTowerTool(None, "token-a") as tool:
+        own = tool.client
+
+    assert not own.is_closed
+    assert not shared.is_closed
+    await base.aclose_shared_client()
+    assert own.is_closed and shared.is_closed
+
+
+@pytest.mark.asyncio
+async def test_make_request_authenticates_with_caller_supplied_client():
+    seen_params = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            seen_params.append(params)
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json={"apps": [1]}, request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    await tool.make_request("/v1/ios/search_entities", {"term": "maps"}, stream=False)
+
+    assert seen_params == [{"term": "maps", "auth_token": "dummy-token"}]
+
+
+def test_validate_date_format_accepts_calendar_dates():
+    assert validate_date_format("2024-02-29") == "2024-02-29"
+
+
+@pytest.mark.parametrize("value", ["2023-02-29", "2024-13-01", "2024-1-5", "20240101", "2024-01-01\n"])
+def test_validate_date_format_rejects_malformed_dates(value):
+    with pytest.raises(ToolError):
+        validate_date_format(value)
+
+
+def test_validate_countries_accepts_code_lists():
+    assert validate_countries("US, gb,WW") == "US, gb,WW"
+
+
+@pytest.mark.parametrize("value", ["", "USA", "US,", "US;GB", "United States"])
+def test_validate_countries_rejects_malformed_lists(value):
+    with pytest.raises(ToolError):
+        validate_countries(value)
+
+
+def test_apply_tool_metadata_gives_each_tool_its_own_docs():
+    class _Tool:
+        meta = None
+
+    first, second = _Tool(), _Tool()
+    apply_tool_metadata(first, "get_app_metadata")
+    apply_tool_metadata(second, "get_app_metadata")
+    original_hint = build_tool_metadata("get_app_metadata")["docs"]["hint"]
+    first.meta["docs"]["hint"] = "changed"
+    first.meta["docs"]["example_arguments"].clear()
+
+    assert second.meta["docs"]["hint"] == original_hint
+    assert build_tool_metadata("get_app_metadata")["docs"]["hint"] == original_hint
+    assert build_tool_metadata("get_app_metadata")["docs"]["example_arguments"]
+
+
+@pytest.mark.asyncio
+async def test_json_loads_stream_decodes_chunked_body():
+    from src.sensortower_mcp.serialization import json_loads_stream
+
+    async def chunks():
+        for part in (b'{"ad_units": [{"id"', b': 1}], "count"', b": 1}"):
+            yield part
+
+    assert await json_loads_stream(chunks()) == {"ad_units": [{"id": 1}], "count": 1}
+
+
+def test_merge_batched_results_concatenates_lists_and_list_fields():
+    assert merge_batched_results([[1, 2], [3]]) == [1, 2, 3]
+    merged = merge_batched_results([{"apps": [1], "total": 1}, {"apps": [2], "total": 1}])
+    assert merged == {"apps": [1, 2], "total": 1}
+
+
+@pytest.mark.asyncio
+async def test_make_request_serves_cacheable_endpoints_from_cache():
+    calls = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            calls.append(endpoint)
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json={"versions": [1]}, request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    clear_response_cache()
+    params = {"app_id": "284882215", "country": "US"}
+    first = await tool.make_request("/v1/ios/apps/version_history", params)
+    second = await tool.make_request("/v1/ios/apps/version_history", params)
+    clear_response_cache()
+
+    assert len(calls) == 1
+    assert first == second == {"versions": [1]}
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_make_request_shares_inflight_requests_for_cacheable_endpoints():
+    calls = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            calls.append(endpoint)
+            await asyncio.sleep(0.01)
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json=[{"aid": 1}], request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    clear_response_cache()
+    params = {"app_ids": "1", "start_date": "2024-01-01", "end_date": "2024-01-31"}
+    first, second = await asyncio.gather(
+        tool.make_request("/v1/ios/sales_report_estimates", params),
+        tool.make_request("/v1/ios/sales_report_estimates", dict(params)),
+    )
+    clear_response_cache()
+
+    assert len(calls) == 1
+    assert first == second == [{"aid": 1}]
+
+
+@pytest.mark.asyncio
+async def test_make_request_waiters_survive_leader_cancellation():
+    calls = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            calls.append(endpoint)
+            await asyncio.sleep(0.02)
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json={"versions": [1]}, request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    clear_response_cache()
+    params = {"app_id": "284882215", "country": "US"}
+
+    leader = asyncio.ensure_future(tool.make_request("/v1/ios/apps/version_history", params))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(tool.make_request("/v1/ios/apps/version_history", dict(params)))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == {"versions": [1]}
+    assert leader.cancelled()
+    assert len(calls) == 1
+    clear_response_cache()
+
+
+@pytest.mark.asyncio
+async def test_make_request_cancels_upstream_call_for_uncached_endpoints():
+    started = asyncio.Event()
+    cancelled = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(endpoint)
+                raise
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    caller = asyncio.ensure_future(
+        tool.make_request("/v1/ios/ad_intel/network_analysis/rank", {"period": "day"})
+    )
+    await started.wait()
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+    assert cancelled == ["/v1/ios/ad_intel/network_analysis/rank"]
+
+
+@pytest.mark.asyncio
+async def test_make_coalesced_request_merges_concurrent_app_calls():
+    seen_app_ids = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            seen_app_ids.append(params["app_ids"])
+            rows = [{"aid": int(app_id), "units": 1} for app_id in params["app_ids"].split(",")]
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json=rows, request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    shared = {"start_date": "2024-01-01", "end_date": "2024-01-31"}
+    first, second = await asyncio.gather(
+        tool.make_coalesced_request("/v1/ios/games_breakdown", {**shared, "app_ids": "1"}),
+        tool.make_coalesced_request("/v1/ios/games_breakdown", {**shared, "app_ids": "2,3"}),
+    )
+
+    assert seen_app_ids == ["1,2,3"]
+    assert first == [{"aid": 1, "units": 1}]
+    assert second == [{"aid": 2, "units": 1}, {"aid": 3, "units": 1}]
+
+
+@pytest.mark.asyncio
+async def test_make_coalesced_request_isolates_callers_from_merged_failures():
+    seen_app_ids = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            seen_app_ids.append(params["app_ids"])
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            if "bad" in params["app_ids"].split(","):
+                return httpx.Response(422, json={"error": "invalid app id"}, request=request)
+            return httpx.Response(200, json=[{"aid": 1, "units": 1}], request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    shared = {"start_date": "2024-01-01", "end_date": "2024-01-31"}
+    good, bad = await asyncio.gather(
+        tool.make_coalesced_request("/v1/ios/games_breakdown", {**shared, "app_ids": "1"}),
+        tool.make_coalesced_request("/v1/ios/games_breakdown", {**shared, "app_ids": "bad"}),
+        return_exceptions=True,
+    )
+
+    assert seen_app_ids[0] == "1,bad"
+    assert sorted(seen_app_ids[1:]) == ["1", "bad"]
+    assert good == [{"aid": 1, "units": 1}]
+    assert isinstance(bad, httpx.HTTPStatusError)
+
+
+@pytest.mark.asyncio
+async def test_make_coalesced_request_keeps_response_order_and_refetches_unmatched_ids():
+    seen_app_ids = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            seen_app_ids.append(params["app_ids"])
+            rows = [{"aid": 2}, {"aid": 1}, {"app_id": "COM.EXAMPLE"}]
+            if params["app_ids"] == "com.example":
+                rows = rows[2:]
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json=rows, request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    shared = {"start_date": "2024-01-01", "end_date": "2024-01-31"}
+    numeric, named = await asyncio.gather(
+        tool.make_coalesced_request("/v1/ios/games_breakdown", {**shared, "app_ids": "1,2"}),
+        tool.make_coalesced_request("/v1/ios/games_breakdown", {**shared, "app_ids": "com.example"}),
+    )
+
+    assert seen_app_ids == ["1,2,com.example", "com.example"]
+    assert numeric == [{"aid": 2}, {"aid": 1}]
+    # The API spelled this ID differently, so its caller asked on its own
+    assert named == [{"app_id": "COM.EXAMPLE"}]
+
+
+@pytest.mark.asyncio
+async def test_make_request_serves_stale_entry_while_refreshing():
+    calls = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            calls.append(endpoint)
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json={"versions": [len(calls)]}, request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    clear_response_cache()
+    params = {"app_id": "284882215", "country": "US"}
+    first = await tool.make_request("/v1/ios/apps/version_history", params)
+    # Age the entry past its fresh window but keep it inside the stale grace
+    for key, (_, _, content) in list(_response_cache.items()):
+        _response_cache[key] = (0.0, float("inf"), content)
+    stale = await tool.make_request("/v1/ios/apps/version_history", params)
+    await asyncio.sleep(0.01)
+    refreshed = await tool.make_request("/v1/ios/apps/version_history", params)
+    clear_response_cache()
+
+    assert len(calls) == 2
+    assert first == stale == {"versions": [1]}
+    assert refreshed == {"versions": [2]}
+
+
+@pytest.mark.asyncio
+async def test_make_coalesced_request_serves_cache_hits_without_waiting(monkeypatch):
+    calls = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            calls.append(params["app_ids"])
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json=[{"aid": 1, "units": 1}], request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    clear_response_cache()
+    params = {"app_ids": "1", "start_date": "2024-01-01", "end_date": "2024-01-31"}
+    first = await tool.make_request("/v1/ios/sales_report_estimates", params)
+
+    # A hit must not sit out the coalescing window
+    monkeypatch.setattr(base, "COALESCE_WINDOW_SECONDS", 30.0)
+    second = await asyncio.wait_for(
+        tool.make_coalesced_request("/v1/ios/sales_report_estimates", dict(params)), timeout=1.0
+    )
+    clear_response_cache()
+
+    assert calls == ["1"]
+    assert first == second == [{"aid": 1, "units": 1}]
+
+
+@pytest.mark.asyncio
+async def test_make_request_remembers_empty_responses_from_cached_endpoints():
+    calls = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            calls.append(endpoint)
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json=[], request=request)
+
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    clear_response_cache()
+
+    async def fetch_twice(endpoint):
+        params = {"app_ids": "1", "start_date": "2024-01-01", "end_date": "2024-01-31"}
+        await tool.make_request(endpoint, params)
+        return await tool.make_request(endpoint, params)
+
+    assert await fetch_twice("/v1/ios/sales_report_estimates") == []
+    assert len(calls) == 1
+    # Endpoints without a TTL, such as realtime ranks, are always refetched
+    assert await fetch_twice("/v1/ios/ad_intel/network_analysis/rank") == []
+    clear_response_cache()
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_make_request_decodes_each_fetched_body_once(monkeypatch):
+    decoded = []
+
+    class _Client:
+        async def get(self, endpoint, params):
+            request = httpx.Request("GET", f"https://api.sensortower.com{endpoint}")
+            return httpx.Response(200, json={"versions": [1]}, request=request)
+
+    def counting_loads(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(base, "json_loads", counting_loads)
+    tool = SensorTowerTool(_Client(), "dummy-token")
+    clear_response_cache()
+    result = await tool.make_request("/v1/ios/apps/version_history", {"app_id": "1"})
+    clear_response_cache()
+
+    assert result == {"versions": [1]}
+    assert len(decoded) == 1
+
+
+def test_response_store_round_trips_until_expiry(tmp_path):
+    from src.sensortower_mcp.response_store import ResponseStore
+
+    store = ResponseStore(str(tmp_path / "cache.sqlite3"))
+    key = ResponseStore.key_for(("dummy-token", "/v1/ios/apps", (("app_ids", "1"),)))
+    store.put(key, 60, b'{"apps": []}')
+    ttl_left, body = store.get(key)
+    store.put("expired", -1, b"[]")
+
+    assert "dummy-token" not in key
+    assert 0 < ttl_left <= 60
+    assert body == b'{"apps": []}'
+    assert store.get("expired") is None
+    store.close()
+
+
+def test_response_store_prunes_expired_rows_on_write(tmp_path):
+    import sqlite3
+
+    from src.sensortower_mcp.response_store import ResponseStore
+
+    path = str(tmp_path / "cache.sqlite3")
+    store = ResponseStore(path)
+    store.put("expired", -1, b"[]")
+    store.put("live", 60, b"[1]")
+    store.close()
+
+    with sqlite3.connect(path) as conn:
+        keys = [row[0] for row in conn.execute("SELECT key FROM responses")]
+    assert keys == ["live"]
@@ -2,33 +2,14 @@
 
 from __future__ import annotations
 
-import ast
-from pathlib import Path
-
 import pytest
 
+from sensortower_mcp.documentation import API_DOCUMENTATION
 from sensortower_mcp.tool_examples import TOOL_ARGUMENT_EXAMPLES
 from tests.tool_manifest import build_tool_manifest
 from tests.tool_registry import load_openapi_required_query_params
 
-DOC_PATH = Path("src/sensortower_mcp/documentation.py")
-
-
-def _extract_resource_text(function_name: str) -> str:
-    module = ast.parse(DOC_PATH.read_text(encoding="utf-8"))
-    for node in module.body:
-        if isinstance(node, ast.FunctionDef) and node.name == "register_documentation":
-            for inner in node.body:
-                if isinstance(inner, ast.FunctionDef) and inner.name == function_name:
-                    for stmt in inner.body:
-                        if isinstance(stmt, ast.Return) and isinstance(stmt.value, ast.Constant):
-                            value = stmt.value.value
-                            if isinstance(value, str):
-                                return value
-    raise RuntimeError(f"Unable to locate resource text for {function_name}")
-
-
-API_DOC_TEXT = _extract_resource_text("api_documentation")
+API_DOC_TEXT = API_DOCUMENTATION
 MANIFEST = build_tool_manifest()
 REQUIRED_QUERY_PARAMS = load_openapi_required_query_params()
 PARAM_ALIASES = {
@@ -0,0 +1,64 @@
+"""Tests for the middleware installed on FastMCP's HTTP app."""
+
+import sys
+
+import pytest
+from starlette.testclient import TestClient
+
+from src.sensortower_mcp.server import (
+    ClaudeDesktopFixMiddleware,
+    HealthShortCircuit,
+    SensorTowerMCPServer,
+)
+
+
+@pytest.fixture
+def http_client(monkeypatch):
+    monkeypatch.setattr(
+        sys, "argv", ["sensortower-mcp", "--transport", "http", "--token", "dummy-token"]
+    )
+    server = SensorTowerMCPServer()
+    server.register_all_tools(server.setup_client())
+    app = server.http_app()
+    with TestClient(app) as client:
+        yield app, client
+
+
+def test_http_app_installs_server_middleware(http_client):
+    app, _ = http_client
+    installed = [middleware.cls for middleware in app.user_middleware]
+    assert HealthShortCircuit in installed
+    assert ClaudeDesktopFixMiddleware in installed
+    # Health probes must not pass through anything else first
+    assert installed.index(HealthShortCircuit) < installed.index(ClaudeDesktopFixMiddleware)
+
+
+def test_http_app_answers_health_checks(http_client):
+    _, client = http_client
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["status"] == "healthy"
+
+
+def test_http_app_accepts_json_only_mcp_clients(http_client):
+    _, client = http_client
+    response = client.post(
+        "/mcp",
+        headers={"Accept": "application/json", "Content-Type": "application/json"},
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-03-26",
+                "capabilities": {},
+                "clientInfo": {"name": "pytest", "version": "0"},
+            },
+        },
+        follow_redirects=True,
+    )
+
+    # Without the Accept fix FastMCP answers 406 Not Acceptable
+    assert response.status_code == 200
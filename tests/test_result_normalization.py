@@ -61,3 +61,16 @@ async def test_scalar_result_wrapped_with_value_key():
     result = await mcp.tools["scalar_tool"]()
     assert isinstance(result, dict)
     assert result["value"] == 7
+
+
+def test_metadata_never_overrides_payload_keys():
+    tool = _DummyTool(client=None, token="token")
+
+    merged = tool.normalize_result({"items": "payload", "a": 1}, {"items": "meta", "b": 2})
+    assert merged == {"items": "payload", "a": 1, "b": 2}
+
+    wrapped = tool.normalize_result([1, 2], {"total_count": 99, "platform": "ios"})
+    assert wrapped == {"items": [1, 2], "total_count": 2, "platform": "ios"}
+
+    scalar = tool.normalize_result(None, {"value": "meta"})
+    assert scalar == {"value": None}
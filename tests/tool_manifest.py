@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import json
 import re
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
@@ -34,6 +36,15 @@ class _MockResponse:
     def json(self) -> Dict[str, Any]:
         return self._payload
 
+    is_error = False
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
+    async def aiter_bytes(self):
+        yield self.content
+
 
 class _MockAsyncClient:
     """Minimal async client matching the interface expected by SensorTowerTool."""
@@ -42,6 +53,11 @@ class _MockAsyncClient:
         await asyncio.sleep(0)
         return _MockResponse(endpoint, params)
 
+    @asynccontextmanager
+    async def stream(self, method: str, endpoint: str, params: Dict[str, Any]):
+        await asyncio.sleep(0)
+        yield _MockResponse(endpoint, params)
+
 
 class _RegisteredTool:
     def __init__(